@@ -17,6 +17,9 @@ class BaseCommandHandler(ABC):
         """Initialize base handler."""
         self._config_manager: ConfigManager | None = None
         self._repository: FileRepository | None = None
+        # Repositories built by this handler, reused across config reloads
+        # that keep the same exclude patterns
+        self._repositories: dict[tuple[str, ...], FileRepository] = {}
         self._registry: CheckerRegistry | None = None
 
     @property
@@ -31,9 +34,12 @@ class BaseCommandHandler(ABC):
     def repository(self) -> FileRepository:
         """Get or create file repository."""
         if self._repository is None:
-            self._repository = FileRepository(
-                exclude_patterns=self.config_manager.get_exclude_patterns()
-            )
+            exclude_patterns = tuple(self.config_manager.get_exclude_patterns())
+            repository = self._repositories.get(exclude_patterns)
+            if repository is None:
+                repository = FileRepository(exclude_patterns=list(exclude_patterns))
+                self._repositories[exclude_patterns] = repository
+            self._repository = repository
         return self._repository
 
     @property
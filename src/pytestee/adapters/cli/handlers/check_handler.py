@@ -28,6 +28,8 @@ class CheckCommandHandler(BaseCommandHandler):
         verbose: bool,
         config_overrides: dict[str, Any] | None = None,
         config_path: Path | None = None,
+        *,
+        project_root: Path | None = None,
     ) -> AnalysisResult:
         """Execute the check command.
 
@@ -38,6 +40,8 @@ class CheckCommandHandler(BaseCommandHandler):
             verbose: Verbose mode flag
             config_overrides: Configuration overrides
             config_path: Path to configuration file
+            project_root: Directory that per-file ignore patterns are relative to
+                (defaults to the current working directory)
 
         Returns:
             Analysis result
@@ -58,6 +62,8 @@ class CheckCommandHandler(BaseCommandHandler):
                 # Reset dependencies to use new config
                 self._registry = None
                 self._repository = None
+            # Always set the root so a previous run's root does not leak into this one
+            self.config_manager.set_project_root(project_root)
             registry = self.registry
         except RuleConflictError as e:
             raise RuleConflictError(
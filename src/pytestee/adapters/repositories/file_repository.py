@@ -1,12 +1,15 @@
 """File repository implementation."""
 
 import fnmatch
+import os
+import re
 from pathlib import Path
 from typing import Optional
 
 from pytestee.domain.interfaces import ITestRepository
 from pytestee.domain.models import TestFile
 from pytestee.infrastructure.ast_parser import ASTParser
+from pytestee.infrastructure.config.glob_trie import GlobTrie, split_path
 
 
 class FileRepository(ITestRepository):
@@ -24,6 +27,12 @@ class FileRepository(ITestRepository):
         """
         self._parser = ASTParser()
         self._exclude_patterns = exclude_patterns or []
+        # Compile patterns once instead of fnmatch translating them per file
+        self._compiled_excludes = [
+            re.compile(fnmatch.translate(pattern)) for pattern in self._exclude_patterns
+        ]
+        # Only used to prune directories covered by an explicit "<prefix>/**"
+        self._exclude_trie = GlobTrie(self._exclude_patterns)
 
     def find_test_files(self, path: Path) -> list[Path]:
         """指定されたパス内のすべてのテストファイルを検索します。
@@ -41,17 +50,47 @@ class FileRepository(ITestRepository):
             if path.suffix == ".py" and self._should_include_file(path):
                 test_files.append(path)
         elif path.is_dir():
-            # Find all Python files first
-            all_py_files = list(path.rglob("*.py"))
-
-            # Filter based on include/exclude patterns
             test_files.extend(
-                file_path for file_path in all_py_files
+                file_path for file_path in self._walk_python_files(path)
                 if self._should_include_file(file_path)
             )
 
         return sorted(test_files)
 
+    def _walk_python_files(self, root: Path) -> list[Path]:
+        """ディレクトリを走査し、除外されたディレクトリを枝刈りしながら.pyファイルを収集します。
+
+        Args:
+            root: 走査を開始するディレクトリ
+
+        Returns:
+            発見された.pyファイルのパスリスト
+
+        """
+        python_files = []
+        # Carry each directory's path segments so pruning never re-splits paths
+        stack = [(root, split_path(root))]
+
+        while stack:
+            directory, segments = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                # Skip unreadable directories instead of aborting the whole walk
+                continue
+            with entries:
+                for entry in entries:
+                    entry_path = directory / entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        entry_segments = (*segments, entry.name)
+                        # Skip directories whose whole contents are excluded (e.g. ".venv/**")
+                        if not self._exclude_trie.covers_directory_parts(entry_segments):
+                            stack.append((entry_path, entry_segments))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        python_files.append(entry_path)
+
+        return python_files
+
     def load_test_file(self, file_path: Path) -> TestFile:
         """テストファイルを読み込み、解析します。
 
@@ -124,18 +163,17 @@ class FileRepository(ITestRepository):
         if not self._exclude_patterns:
             return True
 
-        # Check if file matches any exclude pattern
+        # Check if file name matches any exclude pattern (e.g., "test_skip_*.py")
+        if any(regex.match(file_name) for regex in self._compiled_excludes):
+            return False
+
+        # Check if full path matches any exclude pattern (e.g., "tests/legacy/*")
+        relative_path = str(file_path)
+        posix_path = file_path.as_posix()
         matches_exclude = any(
-            fnmatch.fnmatch(file_name, pattern) for pattern in self._exclude_patterns
+            regex.match(relative_path) or regex.match(posix_path)
+            for regex in self._compiled_excludes
         )
 
-        # Also check full path patterns for exclude (e.g., "**/conftest.py")
-        if not matches_exclude:
-            relative_path = str(file_path)
-            matches_exclude = any(
-                fnmatch.fnmatch(relative_path, pattern) or
-                fnmatch.fnmatch(file_path.as_posix(), pattern)
-                for pattern in self._exclude_patterns
-            )
-
         return not matches_exclude
+
@@ -58,9 +58,32 @@ class EdgeCaseAnalyzer:
         EdgeCaseType.STRING_NONE: [None, "None"],
         EdgeCaseType.STRING_EMPTY: ["", '""', "''"],
         EdgeCaseType.STRING_SPECIAL_CHARS: ["\n", "\t", "\r", "\\n", "\\t", "\\r"],
-        EdgeCaseType.STRING_UNICODE: lambda x: isinstance(x, str) and any(ord(c) > 127 for c in x),
+        EdgeCaseType.STRING_UNICODE: lambda x: isinstance(x, str) and not x.isascii(),
     }
 
+    # Edge case types reported as missing, per category (in report order)
+    NUMERIC_EDGE_TYPES: ClassVar[tuple[EdgeCaseType, ...]] = (
+        EdgeCaseType.NUMERIC_ZERO,
+        EdgeCaseType.NUMERIC_NEGATIVE,
+        EdgeCaseType.NUMERIC_MAX_MIN,
+    )
+
+    COLLECTION_EDGE_TYPES: ClassVar[tuple[EdgeCaseType, ...]] = (
+        EdgeCaseType.COLLECTION_EMPTY,
+        EdgeCaseType.COLLECTION_SINGLE,
+        EdgeCaseType.COLLECTION_LARGE,
+    )
+
+    STRING_EDGE_TYPES: ClassVar[tuple[EdgeCaseType, ...]] = (
+        EdgeCaseType.STRING_NONE,
+        EdgeCaseType.STRING_EMPTY,
+        EdgeCaseType.STRING_SPECIAL_CHARS,
+        EdgeCaseType.STRING_UNICODE,
+        EdgeCaseType.STRING_LONG,
+    )
+
+    SPECIAL_CHARS: ClassVar[tuple[str, ...]] = ("\n", "\t", "\r")
+
     @staticmethod
     def analyze_test_values(test_function: "TestFunction") -> dict[EdgeCaseType, bool]:
         """Analyze a test function for edge case coverage.
@@ -194,9 +217,9 @@ class EdgeCaseAnalyzer:
         elif isinstance(value, str):
             if len(value) == 0:
                 edge_types.append(EdgeCaseType.STRING_EMPTY)
-            elif any(c in value for c in ['\n', '\t', '\r']):
+            elif any(c in value for c in EdgeCaseAnalyzer.SPECIAL_CHARS):
                 edge_types.append(EdgeCaseType.STRING_SPECIAL_CHARS)
-            elif any(ord(c) > 127 for c in value):
+            elif not value.isascii():
                 edge_types.append(EdgeCaseType.STRING_UNICODE)
             elif len(value) > 1000:  # Very long strings
                 edge_types.append(EdgeCaseType.STRING_LONG)
@@ -244,13 +267,7 @@ class EdgeCaseAnalyzer:
         """Get list of missing numeric edge cases."""
         edge_cases_found = EdgeCaseAnalyzer.analyze_test_values(test_function)
 
-        numeric_edge_types = [
-            EdgeCaseType.NUMERIC_ZERO,
-            EdgeCaseType.NUMERIC_NEGATIVE,
-            EdgeCaseType.NUMERIC_MAX_MIN,
-        ]
-
-        return [edge_type for edge_type in numeric_edge_types
+        return [edge_type for edge_type in EdgeCaseAnalyzer.NUMERIC_EDGE_TYPES
                 if not edge_cases_found[edge_type]]
 
     @staticmethod
@@ -258,13 +275,7 @@ class EdgeCaseAnalyzer:
         """Get list of missing collection edge cases."""
         edge_cases_found = EdgeCaseAnalyzer.analyze_test_values(test_function)
 
-        collection_edge_types = [
-            EdgeCaseType.COLLECTION_EMPTY,
-            EdgeCaseType.COLLECTION_SINGLE,
-            EdgeCaseType.COLLECTION_LARGE,
-        ]
-
-        return [edge_type for edge_type in collection_edge_types
+        return [edge_type for edge_type in EdgeCaseAnalyzer.COLLECTION_EDGE_TYPES
                 if not edge_cases_found[edge_type]]
 
     @staticmethod
@@ -272,13 +283,5 @@ class EdgeCaseAnalyzer:
         """Get list of missing string edge cases."""
         edge_cases_found = EdgeCaseAnalyzer.analyze_test_values(test_function)
 
-        string_edge_types = [
-            EdgeCaseType.STRING_NONE,
-            EdgeCaseType.STRING_EMPTY,
-            EdgeCaseType.STRING_SPECIAL_CHARS,
-            EdgeCaseType.STRING_UNICODE,
-            EdgeCaseType.STRING_LONG,
-        ]
-
-        return [edge_type for edge_type in string_edge_types
+        return [edge_type for edge_type in EdgeCaseAnalyzer.STRING_EDGE_TYPES
                 if not edge_cases_found[edge_type]]
@@ -6,6 +6,16 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from pytestee.domain.models import TestClass, TestFunction
 
+# Japanese character ranges: Hiragana, Katakana, CJK Unified Ideographs
+# (incl. Extension A) and half-width Katakana
+_JAPANESE_PATTERN = re.compile(
+    r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF\u3400-\u4DBF\uFF66-\uFF9F]"
+)
+
+# Keywords that must all appear in a function's comments (case-insensitive)
+_AAA_KEYWORDS = ("arrange", "act", "assert")
+_GWT_KEYWORDS = ("given", "when", "then")
+
 
 class PatternAnalyzer:
     """Helper class for analyzing patterns in test functions."""
@@ -22,18 +32,8 @@ class PatternAnalyzer:
             True if AAA pattern is found in comments
 
         """
-        function_lines = PatternAnalyzer._extract_function_lines(
-            test_function, file_content
-        )
-
-        # Extract only actual comments (lines with # outside of strings)
-        comments = PatternAnalyzer._extract_comments(function_lines)
-
-        has_arrange = any("arrange" in comment.lower() for comment in comments)
-        has_act = any("act" in comment.lower() for comment in comments)
-        has_assert = any("assert" in comment.lower() for comment in comments)
-
-        return has_arrange and has_act and has_assert
+        comments = PatternAnalyzer._lowercase_comments(test_function, file_content)
+        return PatternAnalyzer._has_all_keywords(comments, _AAA_KEYWORDS)
 
     @staticmethod
     def find_gwt_comments(test_function: "TestFunction", file_content: str) -> bool:
@@ -47,18 +47,8 @@ class PatternAnalyzer:
             True if GWT pattern is found in comments
 
         """
-        function_lines = PatternAnalyzer._extract_function_lines(
-            test_function, file_content
-        )
-
-        # Extract only actual comments (lines with # outside of strings)
-        comments = PatternAnalyzer._extract_comments(function_lines)
-
-        has_given = any("given" in comment.lower() for comment in comments)
-        has_when = any("when" in comment.lower() for comment in comments)
-        has_then = any("then" in comment.lower() for comment in comments)
-
-        return has_given and has_when and has_then
+        comments = PatternAnalyzer._lowercase_comments(test_function, file_content)
+        return PatternAnalyzer._has_all_keywords(comments, _GWT_KEYWORDS)
 
     @staticmethod
     def find_aaa_or_gwt_comments(test_function: "TestFunction", file_content: str) -> tuple[bool, Optional[str]]:
@@ -72,9 +62,11 @@ class PatternAnalyzer:
             Tuple of (has_pattern, pattern_type) where pattern_type is "AAA", "GWT", or None
 
         """
-        if PatternAnalyzer.find_aaa_comments(test_function, file_content):
+        # Extract the comments once and test both keyword sets against them
+        comments = PatternAnalyzer._lowercase_comments(test_function, file_content)
+        if PatternAnalyzer._has_all_keywords(comments, _AAA_KEYWORDS):
             return True, "AAA"
-        if PatternAnalyzer.find_gwt_comments(test_function, file_content):
+        if PatternAnalyzer._has_all_keywords(comments, _GWT_KEYWORDS):
             return True, "GWT"
         return False, None
 
@@ -89,11 +81,7 @@ class PatternAnalyzer:
             True if Japanese characters are found in function name
 
         """
-        # Japanese character ranges
-        japanese_pattern = re.compile(
-            r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3400-\u4DBF]'
-        )
-        return bool(japanese_pattern.search(test_function.name))
+        return _JAPANESE_PATTERN.search(test_function.name) is not None
 
     @staticmethod
     def has_japanese_characters_in_class(test_class: "TestClass") -> bool:
@@ -106,11 +94,45 @@ class PatternAnalyzer:
             True if Japanese characters are found in class name
 
         """
-        # Japanese character ranges
-        japanese_pattern = re.compile(
-            r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3400-\u4DBF]'
+        return _JAPANESE_PATTERN.search(test_class.name) is not None
+
+    @staticmethod
+    def _lowercase_comments(test_function: "TestFunction", file_content: str) -> list[str]:
+        """Extract the function's comments, lowercased once for keyword matching.
+
+        Args:
+            test_function: The test function to analyze
+            file_content: The full file content
+
+        Returns:
+            List of lowercased comment texts
+
+        """
+        function_lines = PatternAnalyzer._extract_function_lines(
+            test_function, file_content
+        )
+
+        # Extract only actual comments (lines with # outside of strings)
+        return [
+            comment.lower()
+            for comment in PatternAnalyzer._extract_comments(function_lines)
+        ]
+
+    @staticmethod
+    def _has_all_keywords(comments: list[str], keywords: tuple[str, ...]) -> bool:
+        """Check that every keyword appears in at least one comment.
+
+        Args:
+            comments: Lowercased comment texts
+            keywords: Lowercase keywords to look for
+
+        Returns:
+            True if all keywords are found
+
+        """
+        return all(
+            any(keyword in comment for comment in comments) for keyword in keywords
         )
-        return bool(japanese_pattern.search(test_class.name))
 
     @staticmethod
     def _extract_function_lines(test_function: "TestFunction", file_content: str) -> list[str]:
@@ -6,11 +6,16 @@
 """
 
 import ast
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, Union
 
+# 大量に生成されるモデルは__slots__化してインスタンス辞書を持たせない
+# (dataclassのslots引数はPython 3.10以降のみ対応)
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class CheckSeverity(Enum):
     """チェック結果の重要度レベル。
@@ -33,7 +38,7 @@ class PatternType(Enum):
     GWT = "gwt"  # Given, When, Then
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestFunction:
     """コード内のテスト関数を表すクラス。
 
@@ -49,6 +54,8 @@ class TestFunction:
         body: 関数本体のASTステートメントリスト
         docstring: 関数のdocstring(存在する場合)
         decorators: 関数に適用されたデコレーター名のリスト
+        effective_line_count: 定義行を除く、空行・コメント行以外の行数
+            (解析時に算出。未算出の場合はNone)
 
     """
 
@@ -60,6 +67,7 @@ class TestFunction:
     body: list[ast.stmt]
     docstring: Optional[str] = None
     decorators: Optional[list[str]] = None
+    effective_line_count: Optional[int] = None
 
     def __post_init__(self) -> None:
         """オブジェクト作成後の初期化処理を実行します。"""
@@ -68,7 +76,7 @@ class TestFunction:
             self.decorators = []
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestClass:
     """コード内のテストクラスを表すクラス。
 
@@ -108,7 +116,7 @@ class TestClass:
             self.test_methods = []
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestFile:
     """テスト関数を含むテストファイルを表すクラス。
 
@@ -129,6 +137,27 @@ class TestFile:
     ast_tree: ast.AST
     test_functions: list[TestFunction]
     test_classes: list[TestClass]
+    _functions_by_name: Optional[dict[str, TestFunction]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def functions_by_name(self) -> dict[str, TestFunction]:
+        """関数名からテスト関数を引く辞書を取得します。
+
+        初回アクセス時に一度だけ構築し、以降は同じ辞書を返します。
+        同名の関数が複数ある場合は先に定義された関数を優先します。
+
+        Returns:
+            関数名をキーとするテスト関数の辞書
+
+        """
+        if self._functions_by_name is None:
+            functions: dict[str, TestFunction] = {}
+            for test_function in self.test_functions:
+                functions.setdefault(test_function.name, test_function)
+            self._functions_by_name = functions
+        return self._functions_by_name
 
     @property
     def relative_path(self) -> str:
@@ -141,7 +170,7 @@ class TestFile:
         return str(self.path)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CheckResultBase:
     """品質チェック結果の基底クラス。
 
@@ -176,7 +205,7 @@ class CheckResultBase:
             self.context = {}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CheckSuccess(CheckResultBase):
     """品質チェック成功結果。
 
@@ -186,7 +215,7 @@ class CheckSuccess(CheckResultBase):
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CheckFailure(CheckResultBase):
     """品質チェック失敗結果。
 
@@ -1 +1,28 @@
 """Rule modules for pytestee checkers."""
+
+# All built-in rule IDs, shared by the registry and the configuration
+KNOWN_RULE_IDS = (
+    "PTCM001",
+    "PTCM002",
+    "PTCM003",
+    "PTST001",
+    "PTLG001",
+    "PTAS001",
+    "PTAS002",
+    "PTAS003",
+    "PTAS004",
+    "PTAS005",
+    "PTNM001",
+    "PTNM002",
+    "PTNM003",
+    "PTVL001",
+    "PTVL002",
+    "PTVL003",
+    "PTVL004",
+    "PTVL005",
+    "PTEC001",
+    "PTEC002",
+    "PTEC003",
+    "PTEC004",
+    "PTEC005",
+)
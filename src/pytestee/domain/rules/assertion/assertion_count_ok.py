@@ -9,6 +9,10 @@ if TYPE_CHECKING:
     from pytestee.domain.analyzers.assertion_analyzer import AssertionAnalyzer
 
 
+# Conflicts with too few and no assertions
+_CONFLICTING_RULES = frozenset({"PTAS001", "PTAS004"})
+
+
 class PTAS005(BaseRule):
     """Rule for indicating appropriate assertion count."""
 
@@ -59,6 +63,6 @@ class PTAS005(BaseRule):
             return config.config.get(key, default)
         return default
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTAS005 conflicts with other assertion count rules."""
-        return {"PTAS001", "PTAS004"}  # Conflicts with too few and no assertions
+        return _CONFLICTING_RULES
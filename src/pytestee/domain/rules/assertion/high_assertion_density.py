@@ -60,6 +60,10 @@ class PTAS003(BaseRule):
         self, test_function: TestFunction, test_file: TestFile
     ) -> int:
         """Count effective lines of code (excluding blank lines and comments)."""
+        # Precomputed by the parser; recount only for hand-built functions
+        if test_function.effective_line_count is not None:
+            return test_function.effective_line_count
+
         lines = test_file.content.split("\n")
         start_line = test_function.lineno - 1  # Convert to 0-based index
         end_line = test_function.end_lineno or start_line + len(test_function.body)
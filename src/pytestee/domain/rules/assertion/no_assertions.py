@@ -9,6 +9,10 @@ if TYPE_CHECKING:
     from pytestee.domain.analyzers.assertion_analyzer import AssertionAnalyzer
 
 
+# Conflicts with all count-based rules
+_CONFLICTING_RULES = frozenset({"PTAS001", "PTAS002", "PTAS005"})
+
+
 class PTAS004(BaseRule):
     """Rule for detecting functions with no assertions."""
 
@@ -39,6 +43,6 @@ class PTAS004(BaseRule):
             f"Assertions found: {assert_count} assertions", test_file, test_function
         )
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTAS004 conflicts with all other assertion count rules."""
-        return {"PTAS001", "PTAS002", "PTAS005"}  # Conflicts with all count-based rules
+        return _CONFLICTING_RULES
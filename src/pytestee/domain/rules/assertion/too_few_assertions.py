@@ -9,6 +9,10 @@ if TYPE_CHECKING:
     from pytestee.domain.analyzers.assertion_analyzer import AssertionAnalyzer
 
 
+# Conflicts with no assertions and assertion count OK
+_CONFLICTING_RULES = frozenset({"PTAS004", "PTAS005"})
+
+
 class PTAS001(BaseRule):
     """Rule for detecting too few assertions."""
 
@@ -50,9 +54,6 @@ class PTAS001(BaseRule):
             return config.config.get(key, default)
         return default
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTAS001 conflicts with other assertion count rules."""
-        return {
-            "PTAS004",
-            "PTAS005",
-        }  # Conflicts with no assertions and assertion count OK
+        return _CONFLICTING_RULES
@@ -9,6 +9,10 @@ if TYPE_CHECKING:
     from pytestee.domain.analyzers.assertion_analyzer import AssertionAnalyzer
 
 
+# Conflicts with no assertions
+_CONFLICTING_RULES = frozenset({"PTAS004"})
+
+
 class PTAS002(BaseRule):
     """Rule for detecting too many assertions."""
 
@@ -50,6 +54,6 @@ class PTAS002(BaseRule):
             return config.config.get(key, default)
         return default
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTAS002 conflicts with no assertions rule."""
-        return {"PTAS004"}  # Conflicts with no assertions
+        return _CONFLICTING_RULES
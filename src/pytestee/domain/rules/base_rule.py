@@ -91,13 +91,13 @@ class BaseRule(ABC):
         """設定管理を設定する。"""
         self.config_manager = config_manager
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """このルールと競合するルールIDのセットを返す。
 
         サブクラスでオーバーライドして競合ルールを定義。
         デフォルトでは競合ルールなし。
         """
-        return set()
+        return frozenset()
 
     def _create_success_result(
         self,
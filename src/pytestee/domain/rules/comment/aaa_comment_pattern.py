@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     )
 
 
+_CONFLICTING_RULES = frozenset({"PTCM003"})
+
+
 class PTCM001(BaseRule):
     """Rule for detecting AAA pattern in comments."""
 
@@ -47,6 +50,6 @@ class PTCM001(BaseRule):
             test_function,
         )
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTCM001はPTCM003と競合する。"""
-        return {"PTCM003"}
+        return _CONFLICTING_RULES
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     )
 
 
+_CONFLICTING_RULES = frozenset({"PTCM001", "PTCM002"})
+
+
 class PTCM003(BaseRule):
     """Composite rule for detecting either AAA or GWT pattern in comments."""
 
@@ -49,6 +52,6 @@ class PTCM003(BaseRule):
             test_function,
         )
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """PTCM003はPTCM001とPTCM002と競合する。"""
-        return {"PTCM001", "PTCM002"}
+        return _CONFLICTING_RULES
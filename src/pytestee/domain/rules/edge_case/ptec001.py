@@ -108,6 +108,6 @@ class PTEC001(BaseRule):
 
         return False
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """No conflicting rules for numeric edge case detection."""
-        return set()
+        return frozenset()
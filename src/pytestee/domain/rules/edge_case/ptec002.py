@@ -120,6 +120,6 @@ class PTEC002(BaseRule):
 
         return False
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """No conflicting rules for collection edge case detection."""
-        return set()
+        return frozenset()
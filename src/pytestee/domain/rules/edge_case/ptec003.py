@@ -127,6 +127,6 @@ class PTEC003(BaseRule):
 
         return False
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """No conflicting rules for string edge case detection."""
-        return set()
+        return frozenset()
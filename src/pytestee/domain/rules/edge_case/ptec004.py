@@ -86,6 +86,6 @@ class PTEC004(BaseRule):
             test_function,
         )
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """No conflicting rules for ratio analysis."""
-        return set()
+        return frozenset()
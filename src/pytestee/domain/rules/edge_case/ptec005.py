@@ -188,6 +188,6 @@ class PTEC005(BaseRule):
                     return True
         return False
 
-    def get_conflicting_rules(self) -> set[str]:
+    def get_conflicting_rules(self) -> frozenset[str]:
         """No conflicting rules for overall coverage scoring."""
-        return set()
+        return frozenset()
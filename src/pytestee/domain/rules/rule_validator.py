@@ -1,14 +1,53 @@
 """Rule validation system to prevent conflicting rule configurations."""
 
-from typing import Any, Optional
+from collections.abc import Iterable, Set
+from typing import Any, Callable, Optional
 
 from pytestee.domain.rules.base_rule import BaseRule
 
+# Single-parameter checks as (key, is_valid, message), in reporting order.
+# Only keys present in the config are checked; the defaults are always valid.
+_PARAMETER_CHECKS: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    ("min_asserts", lambda value: value >= 0, "min_asserts cannot be negative"),
+    ("max_asserts", lambda value: value >= 1, "max_asserts must be at least 1"),
+    (
+        "max_density",
+        lambda value: 0.0 <= value <= 1.0,
+        "max_density must be between 0.0 and 1.0",
+    ),
+)
+
 
 class RuleConflictError(Exception):
-    """Raised when conflicting rules are configured simultaneously."""
+    """Raised when conflicting rules are configured simultaneously.
+
+    When raised for conflicting rule groups (each a sorted tuple of rule IDs)
+    without an explicit message, the message is only formatted once the
+    error is actually displayed.
+    """
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        conflicting_rules: Iterable[tuple[str, ...]] = (),
+    ) -> None:
+        self.conflicting_rules = tuple(conflicting_rules)
+        # Keep both arguments in args so repr() and pickling preserve them
+        super().__init__(message, self.conflicting_rules)
 
-    pass
+    def __str__(self) -> str:
+        """Return the explicit message, or describe the conflicting rule groups."""
+        message = self.args[0]
+        if message is not None:
+            return str(message)
+        if not self.conflicting_rules:
+            return ""
+
+        conflict_descriptions = (
+            f"Rules {', '.join(conflict_group)} are mutually exclusive"
+            for conflict_group in self.conflicting_rules
+        )
+        return "Conflicting rules detected:\n" + "\n".join(conflict_descriptions)
 
 
 class RuleValidator:
@@ -20,7 +59,7 @@ class RuleValidator:
     @classmethod
     def validate_rule_selection(
         cls,
-        selected_rules: set[str],
+        selected_rules: Set[str],
         rule_instances: Optional[dict[str, BaseRule]] = None,
     ) -> None:
         """Validate that selected rules don't conflict with each other.
@@ -38,65 +77,54 @@ class RuleValidator:
             conflicts = []
 
         if conflicts:
-            conflict_descriptions = []
-            for conflict_group in conflicts:
-                rules_str = ", ".join(sorted(conflict_group))
-                conflict_descriptions.append(
-                    f"Rules {rules_str} are mutually exclusive"
-                )
-
-            raise RuleConflictError(
-                "Conflicting rules detected:\n" + "\n".join(conflict_descriptions)
-            )
+            raise RuleConflictError(conflicting_rules=conflicts)
 
     @classmethod
     def validate_config_parameters(cls, config: dict[str, Any]) -> None:
         """Validate configuration parameters for logical consistency."""
-        min_asserts = config.get("min_asserts", 1)
-        max_asserts = config.get("max_asserts", 3)
-
-        if min_asserts > max_asserts:
-            raise RuleConflictError(
-                f"min_asserts ({min_asserts}) cannot be greater than max_asserts ({max_asserts})"
-            )
-
-        if min_asserts < 0:
-            raise RuleConflictError("min_asserts cannot be negative")
-
-        if max_asserts < 1:
-            raise RuleConflictError("max_asserts must be at least 1")
+        # The cross-parameter check is reported before the single-parameter
+        # ones, and only needed when at least one side is configured
+        if "min_asserts" in config or "max_asserts" in config:
+            min_asserts = config.get("min_asserts", 1)
+            max_asserts = config.get("max_asserts", 3)
+            if min_asserts > max_asserts:
+                raise RuleConflictError(
+                    f"min_asserts ({min_asserts}) cannot be greater than max_asserts ({max_asserts})"
+                )
 
-        max_density = config.get("max_density", 0.5)
-        if not (0.0 <= max_density <= 1.0):
-            raise RuleConflictError("max_density must be between 0.0 and 1.0")
+        for key, is_valid, message in _PARAMETER_CHECKS:
+            if key in config and not is_valid(config[key]):
+                raise RuleConflictError(message)
 
     @classmethod
     def _find_dynamic_conflicts(
-        cls, selected_rules: set[str], rule_instances: dict[str, BaseRule]
-    ) -> list[set[str]]:
-        """Find conflicting rule groups using dynamic conflicts from rule instances."""
-        conflicts = []
-        checked_pairs = set()
-
-        # Check all pairs of selected rules for conflicts
-        selected_list = list(selected_rules)
-        for i, rule_id in enumerate(selected_list):
-            if rule_id not in rule_instances:
-                continue
+        cls, selected_rules: Set[str], rule_instances: dict[str, BaseRule]
+    ) -> list[tuple[str, ...]]:
+        """Find conflicting rule groups using dynamic conflicts from rule instances.
 
-            rule_instance = rule_instances[rule_id]
-            conflicting_rules = rule_instance.get_conflicting_rules()
-
-            # Check remaining rules for conflicts
-            for other_rule_id in selected_list[i + 1 :]:
-                if other_rule_id in conflicting_rules:
-                    # Found a conflict between two selected rules
-                    conflict_pair = {rule_id, other_rule_id}
-                    conflict_key = tuple(sorted(conflict_pair))
+        Each group is returned as a sorted tuple, ready for reporting.
+        """
+        conflicts: list[tuple[str, ...]] = []
+        checked_pairs: set[tuple[str, ...]] = set()
+
+        # Intersect each selected rule's conflicts with the selection instead of
+        # scanning every pair; sorted so the reported order is deterministic
+        for rule_id in sorted(selected_rules):
+            rule_instance = rule_instances.get(rule_id)
+            if rule_instance is None:
+                continue
 
-                    if conflict_key not in checked_pairs:
-                        conflicts.append(conflict_pair)
-                        checked_pairs.add(conflict_key)
+            for other_rule_id in sorted(
+                rule_instance.get_conflicting_rules() & selected_rules
+            ):
+                conflict_pair = (
+                    (rule_id, other_rule_id)
+                    if rule_id < other_rule_id
+                    else (other_rule_id, rule_id)
+                )
+                if conflict_pair not in checked_pairs:
+                    conflicts.append(conflict_pair)
+                    checked_pairs.add(conflict_pair)
 
         return conflicts
 
@@ -108,9 +136,8 @@ class RuleValidator:
         if base_rule not in rule_instances:
             return set()
 
-        all_rules = set(rule_instances.keys())
-        rule_instance = rule_instances[base_rule]
-        conflicting_rules = rule_instance.get_conflicting_rules()
+        conflicting_rules = rule_instances[base_rule].get_conflicting_rules()
 
         # Return all rules except the base rule and its conflicting rules
-        return all_rules - conflicting_rules - {base_rule}
+        # (set operations on the keys view avoid copying the keys first)
+        return rule_instances.keys() - conflicting_rules - {base_rule}
@@ -1,21 +1,60 @@
 """AST parser for analyzing Python test files."""
 
 import ast
+import functools
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Optional
 
 from pytestee.domain.models import TestClass, TestFile, TestFunction
 
+# Parsed files kept per parser; old versions of edited files age out
+_PARSE_CACHE_SIZE = 128
+
 
 class ASTParser:
     """Parser for analyzing Python AST to extract test information."""
 
+    def __init__(self) -> None:
+        """Initialize the parser with its own bounded parse cache."""
+        # Bound to this instance so subclass overrides of _parse_file_uncached apply
+        self._parse_file_cached = functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(
+            self._parse_file_versioned
+        )
+
     def parse_file(self, file_path: Path) -> TestFile:
-        """Parse a Python test file and extract test functions and test classes."""
+        """Parse a Python test file and extract test functions and test classes.
+
+        Results are cached per resolved file path and invalidated when the
+        file's modification time or size changes. Each call returns its own
+        TestFile, so callers never share the cached one's lists.
+        """
+        resolved_path = file_path.resolve()
+        stat = resolved_path.stat()
+        cached = self._parse_file_cached(resolved_path, stat.st_mtime_ns, stat.st_size)
+        return replace(
+            cached,
+            path=file_path,
+            test_functions=list(cached.test_functions),
+            test_classes=list(cached.test_classes),
+        )
+
+    def _parse_file_versioned(
+        self, file_path: Path, mtime_ns: int, size: int
+    ) -> TestFile:
+        """Parse a file once per (path, mtime, size) cache key.
+
+        mtime_ns and size are only part of the cache key so that edited files
+        are parsed again.
+        """
+        return self._parse_file_uncached(file_path)
+
+    def _parse_file_uncached(self, file_path: Path) -> TestFile:
+        """Read and parse a Python test file without consulting the cache."""
         content = file_path.read_text(encoding="utf-8")
         tree = ast.parse(content, filename=str(file_path))
 
-        test_functions = self._extract_test_functions(tree)
+        test_functions = self._extract_test_functions(tree, content.split("\n"))
         test_classes = self._extract_test_classes(tree)
 
         return TestFile(
@@ -26,13 +65,19 @@ class ASTParser:
             test_classes=test_classes,
         )
 
-    def _extract_test_functions(self, tree: ast.AST) -> list[TestFunction]:
-        """Extract test functions from AST."""
+    def _extract_test_functions(
+        self, tree: ast.AST, lines: Optional[list[str]] = None
+    ) -> list[TestFunction]:
+        """Extract test functions from AST.
+
+        When the source lines are given, each function's effective line count
+        is computed here so rules do not re-split the file per function.
+        """
         test_functions = []
 
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef) and self._is_test_function(node):
-                test_function = self._create_test_function(node)
+                test_function = self._create_test_function(node, lines)
                 test_functions.append(test_function)
 
         return test_functions
@@ -69,10 +114,15 @@ class ASTParser:
 
         return False
 
-    def _create_test_function(self, node: ast.FunctionDef) -> TestFunction:
+    def _create_test_function(
+        self, node: ast.FunctionDef, lines: Optional[list[str]] = None
+    ) -> TestFunction:
         """Create a TestFunction from an AST node."""
         docstring = ast.get_docstring(node)
         decorators = self._extract_decorators(node)
+        effective_line_count = (
+            None if lines is None else self._count_effective_lines(node, lines)
+        )
 
         return TestFunction(
             name=node.name,
@@ -83,8 +133,22 @@ class ASTParser:
             body=node.body,
             docstring=docstring,
             decorators=decorators,
+            effective_line_count=effective_line_count,
         )
 
+    def _count_effective_lines(self, node: ast.FunctionDef, lines: list[str]) -> int:
+        """Count non-blank, non-comment lines after the function definition line."""
+        start_line = node.lineno - 1  # Convert to 0-based index
+        end_line = getattr(node, "end_lineno", None) or start_line + len(node.body)
+
+        effective_lines = 0
+        for line in lines[start_line + 1 : end_line]:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                effective_lines += 1
+
+        return effective_lines
+
     def _extract_decorators(self, node: ast.FunctionDef) -> list[str]:
         """Extract decorator names from a function."""
         decorators = []
@@ -0,0 +1,173 @@
+"""Segment trie for matching a path against many glob patterns at once."""
+
+import fnmatch
+import re
+from collections.abc import Iterable, Sequence
+from pathlib import PurePath
+
+_GLOBSTAR_SUFFIX = "/**"
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+class _TrieNode:
+    """A single literal path segment position within the glob trie."""
+
+    __slots__ = ("literals", "tails", "terminals")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _TrieNode] = {}
+        self.tails: list[tuple[re.Pattern[str], int]] = []
+        self.terminals: list[int] = []
+
+
+class GlobTrie:
+    """Trie of glob patterns indexed by their literal leading segments (ruff-like).
+
+    Patterns keep ``fnmatch`` semantics (``*`` also matches ``/``). Each
+    pattern is split on ``/`` and inserted segment by segment:
+
+    - literal leading segments become dict edges (``tests`` / ``unit``)
+    - the rest of the pattern from its first wildcard segment on
+      (``**/test_*.py``) is compiled once into a single fnmatch regex
+
+    A query follows the path's literal segments through the trie and only
+    runs the tail regexes stored along that route, instead of running one
+    ``fnmatch`` per pattern.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._root = _TrieNode()
+        # "<prefix>/**" patterns indexed by their prefix, for covers_directory
+        self._directory_root = _TrieNode()
+        self._patterns: list[str] = []
+
+        for pattern in patterns:
+            pattern_id = len(self._patterns)
+            self._insert(self._root, pattern, pattern_id)
+            normalized = pattern.replace("\\", "/")
+            if normalized.endswith(_GLOBSTAR_SUFFIX):
+                prefix = normalized[: -len(_GLOBSTAR_SUFFIX)]
+                self._insert(self._directory_root, prefix, pattern_id)
+            self._patterns.append(pattern)
+
+    @property
+    def patterns(self) -> list[str]:
+        """Patterns in insertion order (indexed by the IDs returned from match)."""
+        return self._patterns
+
+    def match(self, path: str) -> tuple[int, ...]:
+        """Return indices of all patterns matching the given path.
+
+        Args:
+            path: Relative path (Windows separators are normalized)
+
+        Returns:
+            Matching pattern indices in insertion order
+
+        """
+        return self._collect(self._root, _split(path))
+
+    def match_parts(self, parts: Sequence[str]) -> tuple[int, ...]:
+        """Return indices of all patterns matching an already split path.
+
+        Callers holding path segments (see split_path) skip building and
+        re-splitting a path string.
+
+        Args:
+            parts: Path segments, without separators
+
+        Returns:
+            Matching pattern indices in insertion order
+
+        """
+        return self._collect(self._root, parts)
+
+    def covers_directory(self, path: str) -> bool:
+        """Check if some pattern matches every path below the given directory.
+
+        Used to prune whole directories (e.g. ``.venv/**``) without visiting
+        their contents.
+
+        Args:
+            path: Directory path (Windows separators are normalized)
+
+        Returns:
+            True if a pattern of the form ``<prefix>/**`` has a prefix
+            matching the directory
+
+        """
+        return self.covers_directory_parts(_split(path))
+
+    def covers_directory_parts(self, parts: Sequence[str]) -> bool:
+        """Check covers_directory for an already split directory path.
+
+        Args:
+            parts: Directory path segments, without separators
+
+        Returns:
+            True if a pattern of the form ``<prefix>/**`` has a prefix
+            matching the directory
+
+        """
+        return bool(self._collect(self._directory_root, parts))
+
+    def _insert(self, root: _TrieNode, pattern: str, pattern_id: int) -> None:
+        """Insert a pattern below the given root node."""
+        node = root
+        segments = _split(pattern)
+        for index, segment in enumerate(segments):
+            if not _WILDCARD_CHARS.isdisjoint(segment):
+                # Compile the remaining pattern once here instead of fnmatch
+                # translating per query. translate() emits lookahead groups for
+                # each "*", so patterns like "*a*b*c*" cannot backtrack
+                # exponentially
+                tail = re.compile(fnmatch.translate("/".join(segments[index:])))
+                node.tails.append((tail, pattern_id))
+                return
+            node = node.literals.setdefault(segment, _TrieNode())
+        node.terminals.append(pattern_id)
+
+    def _collect(self, root: _TrieNode, parts: Sequence[str]) -> tuple[int, ...]:
+        """Follow the literal segments from root, collecting matching pattern indices."""
+        matched: set[int] = set()
+        node = root
+        for index, segment in enumerate(parts):
+            if node.tails:
+                rest = "/".join(parts[index:])
+                matched.update(
+                    pattern_id for tail, pattern_id in node.tails if tail.match(rest)
+                )
+            literal_node = node.literals.get(segment)
+            if literal_node is None:
+                break
+            node = literal_node
+        else:
+            matched.update(node.terminals)
+        return tuple(sorted(matched))
+
+
+def split_path(path: PurePath) -> tuple[str, ...]:
+    """Split a path into the segments GlobTrie matches against.
+
+    Equivalent to splitting ``path.as_posix()``, but reuses the parts pathlib
+    has already computed.
+
+    Args:
+        path: Path to split
+
+    Returns:
+        Path segments (the root separator itself is not a segment)
+
+    """
+    if path.anchor:
+        return (*_split(path.anchor), *path.parts[1:])
+    return path.parts
+
+
+def _split(path: str) -> list[str]:
+    """Split a path or pattern into non-empty segments."""
+    return [
+        segment
+        for segment in path.replace("\\", "/").split("/")
+        if segment and segment != "."
+    ]
@@ -1,5 +1,7 @@
 """Configuration management for pytestee."""
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -10,11 +12,42 @@ except ImportError:
 
 from pytestee.domain.interfaces import IConfigManager
 from pytestee.domain.models import CheckerConfig
+from pytestee.domain.rules import KNOWN_RULE_IDS
 from pytestee.domain.rules.rule_validator import RuleValidator
+from pytestee.infrastructure.config.glob_trie import GlobTrie, split_path
 
 # Define type alias for configuration values
 ConfigValue = Union[str, int, float, bool, dict[str, Any], list]
 
+_KNOWN_RULE_ID_SET = frozenset(KNOWN_RULE_IDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_toml(content: bytes) -> dict[str, Any]:
+    """Parse TOML content, reusing the result for identical file contents."""
+    return tomllib.loads(content.decode("utf-8"))
+
+
+def _merge_tables(base: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    """Deep-merge update into a copy of base (update takes precedence).
+
+    Nested tables are copied before being merged into, so dicts shared with
+    base (such as the defaults) are never mutated. Works with an explicit
+    stack instead of recursion.
+    """
+    merged = dict(base)
+    pending = [(merged, update)]
+    while pending:
+        target, overrides = pending.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = dict(current)
+                pending.append((target[key], value))
+            else:
+                target[key] = value
+    return merged
+
 
 class ConfigManager(IConfigManager):
     """Configuration manager for pytestee."""
@@ -71,12 +104,32 @@ class ConfigManager(IConfigManager):
             # Per-file rule ignores (ruff-like)
             "per_file_ignores": {},
         }
+        # Explicitly loaded config file, reused when reloading without a path
+        self._config_path: Optional[Path] = None
+        # Root that per_file_ignores patterns are relative to (defaults to cwd)
+        self._project_root: Optional[Path] = None
+        # Structures compiled from _config, and the config dict they were built from
+        self._compiled_config: Optional[dict[str, Any]] = None
+        self._ignore_trie: Optional[GlobTrie] = None
+        self._globally_enabled_rules: Optional[frozenset[str]] = None
+        self._checker_config_cache: dict[str, CheckerConfig] = {}
+        # Per-file results, keyed by (root in effect, file path)
+        self._file_ignores_cache: dict[tuple[Path, Path], tuple[str, ...]] = {}
+        self._effective_rules_cache: dict[tuple[Path, Path], frozenset[str]] = {}
 
     def load_config(self, config_path: Optional[Path] = None) -> dict[str, Any]:
-        """Load configuration from file or defaults."""
+        """Load configuration from file or defaults.
+
+        Reloading without a path re-reads the file given to a previous call.
+        """
         # Start with defaults
         self._config = self._default_config.copy()
 
+        if config_path:
+            self._config_path = config_path
+        else:
+            config_path = self._config_path
+
         # Try to load from various sources
         config_sources = []
 
@@ -106,6 +159,7 @@ class ConfigManager(IConfigManager):
 
         # Override with environment variables (always apply)
         self._load_from_env()
+        self._invalidate_compiled_patterns()
 
         # Note: Rule validation will be performed later when checker registry is available
 
@@ -117,8 +171,8 @@ class ConfigManager(IConfigManager):
             return None
 
         try:
-            with Path(file_path).open("rb") as f:
-                data = tomllib.load(f)
+            # Parsed documents are cached by content; copy so merges can't mutate the cache
+            data = copy.deepcopy(_parse_toml(file_path.read_bytes()))
 
             # Handle pyproject.toml format
             if file_path.name == "pyproject.toml":
@@ -136,20 +190,7 @@ class ConfigManager(IConfigManager):
 
     def _merge_config(self, new_config: dict[str, Any]) -> None:
         """Merge new configuration with existing."""
-
-        def deep_merge(base: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
-            for key, value in update.items():
-                if (
-                    key in base
-                    and isinstance(base[key], dict)
-                    and isinstance(value, dict)
-                ):
-                    deep_merge(base[key], value)
-                else:
-                    base[key] = value
-            return base
-
-        deep_merge(self._config, new_config)
+        self._config = _merge_tables(self._config, new_config)
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
@@ -158,7 +199,20 @@ class ConfigManager(IConfigManager):
         pass
 
     def get_checker_config(self, checker_name: str) -> CheckerConfig:
-        """Get configuration for a specific checker."""
+        """Get configuration for a specific checker.
+
+        The merged config is built once per configuration and shared between
+        callers, so it must be treated as read-only.
+        """
+        self._sync_compiled_state()
+        checker_config = self._checker_config_cache.get(checker_name)
+        if checker_config is None:
+            checker_config = self._build_checker_config(checker_name)
+            self._checker_config_cache[checker_name] = checker_config
+        return checker_config
+
+    def _build_checker_config(self, checker_name: str) -> CheckerConfig:
+        """Merge rule-specific and legacy configuration for a checker."""
         # For rule-specific config, check under rules namespace
         rule_config = self._config.get("rules", {}).get(checker_name, {})
 
@@ -184,11 +238,13 @@ class ConfigManager(IConfigManager):
     def set_config(self, key: str, value: ConfigValue) -> None:
         """Set a configuration value."""
         self._config[key] = value
+        self._invalidate_compiled_patterns()
 
     def apply_overrides(self, overrides: dict[str, Any]) -> None:
         """Apply configuration overrides temporarily."""
         for key, value in overrides.items():
             self._config[key] = value
+        self._invalidate_compiled_patterns()
 
     def get_config(
         self, key: str, default: Optional[ConfigValue] = None
@@ -198,6 +254,12 @@ class ConfigManager(IConfigManager):
 
     def is_rule_enabled(self, rule_id: str) -> bool:
         """Check if a specific rule is enabled using select/ignore patterns."""
+        if rule_id in _KNOWN_RULE_ID_SET:
+            return rule_id in self._get_globally_enabled_rules()
+        return self._matches_select_and_ignore(rule_id)
+
+    def _matches_select_and_ignore(self, rule_id: str) -> bool:
+        """Resolve a rule against the select/ignore patterns."""
         select_patterns = self._config.get("select", [])
         ignore_patterns = self._config.get("ignore", [])
 
@@ -217,16 +279,9 @@ class ConfigManager(IConfigManager):
 
     def _matches_patterns(self, rule_id: str, patterns: list[str]) -> bool:
         """Check if rule_id matches any pattern in the list."""
-        return any(self._matches_pattern(rule_id, pattern) for pattern in patterns)
-
-    def _matches_pattern(self, rule_id: str, pattern: str) -> bool:
-        """Check if rule_id matches a single pattern."""
-        # Exact match
-        if rule_id == pattern:
-            return True
-
-        # Prefix match (e.g., "PTCM" matches "PTCM001", "PTCM002")
-        return bool(rule_id.startswith(pattern))
+        # An exact match is also a prefix match, so one startswith call covers
+        # every pattern
+        return rule_id.startswith(tuple(patterns))
 
     def get_rule_severity(self, rule_id: str) -> str:
         """Get severity level for a specific rule from configuration."""
@@ -266,29 +321,14 @@ class ConfigManager(IConfigManager):
 
     def _expand_rule_patterns(self, patterns: list[str]) -> set[str]:
         """Expand rule patterns like 'PTCM' to actual rule IDs like 'PTCM001', 'PTCM002'."""
-        all_rules = {
-            "PTCM001",
-            "PTCM002",
-            "PTCM003",
-            "PTST001",
-            "PTLG001",
-            "PTAS001",
-            "PTAS002",
-            "PTAS003",
-            "PTAS004",
-            "PTAS005",
-            "PTNM001",
-            "PTNM002",
-        }
-
         expanded_rules = set()
         for pattern in patterns:
             # Exact matches
-            if pattern in all_rules:
+            if pattern in _KNOWN_RULE_ID_SET:
                 expanded_rules.add(pattern)
             else:
                 # Prefix matches
-                for rule_id in all_rules:
+                for rule_id in KNOWN_RULE_IDS:
                     if rule_id.startswith(pattern):
                         expanded_rules.add(rule_id)
 
@@ -305,6 +345,16 @@ class ConfigManager(IConfigManager):
         """
         self._validate_rule_selection(rule_instances)
 
+    def set_project_root(self, project_root: Optional[Path]) -> None:
+        """Set the directory that per_file_ignores patterns are relative to.
+
+        Args:
+            project_root: Project root directory, or None to use the current directory
+
+        """
+        self._project_root = project_root
+        self._invalidate_compiled_patterns()
+
     def get_exclude_patterns(self) -> list[str]:
         """Get file exclude patterns."""
         return self._config.get("exclude", [])
@@ -323,37 +373,47 @@ class ConfigManager(IConfigManager):
         if not per_file_ignores:
             return []
 
-        # Convert file path to relative path from project root
-        relative_path_str = self._get_relative_path_for_matching(file_path, per_file_ignores)
-        if relative_path_str is None:
-            return []
+        self._sync_compiled_state()
+        cache_key = self._file_cache_key(file_path)
+        file_ignores = self._file_ignores_cache.get(cache_key)
+        if file_ignores is None:
+            # Convert file path to relative path segments from project root
+            relative_parts = self._get_relative_parts_for_matching(file_path, per_file_ignores)
+            file_ignores = (
+                ()
+                if relative_parts is None
+                else tuple(self._collect_file_ignores(relative_parts, per_file_ignores))
+            )
+            self._file_ignores_cache[cache_key] = file_ignores
+        return list(file_ignores)
 
-        # Collect all matching ignore patterns
-        file_ignores = []
-        for pattern, ignores in per_file_ignores.items():
-            if self._matches_file_pattern(relative_path_str, pattern):
-                if isinstance(ignores, list):
-                    file_ignores.extend(ignores)
-                elif isinstance(ignores, str):
-                    file_ignores.append(ignores)
+    def _file_cache_key(self, file_path: Path) -> tuple[Path, Path]:
+        """Build the per-file cache key, including the root paths are made relative to.
 
-        return file_ignores
+        Without a project root the current directory is used, so results stay
+        correct when the working directory changes between calls.
+        """
+        return (self._project_root or Path.cwd(), file_path)
+
+    def _get_relative_parts_for_matching(self, file_path: Path, per_file_ignores: dict[str, Union[list[str], str]]) -> Optional[tuple[str, ...]]:
+        """Get relative path segments for pattern matching, with special handling for external files.
 
-    def _get_relative_path_for_matching(self, file_path: Path, per_file_ignores: dict[str, Union[list[str], str]]) -> Optional[str]:
-        """Get relative path for pattern matching, with special handling for external files."""
+        Segments come straight from pathlib, so the path is never rendered to a
+        string and re-split by the trie.
+        """
         if file_path.is_absolute():
             try:
-                # Try to get relative path from current working directory
-                relative_path = file_path.relative_to(Path.cwd())
-                return str(relative_path)
+                # Try to get relative path from the project root (or working directory)
+                relative_path = file_path.relative_to(self._project_root or Path.cwd())
+                return split_path(relative_path)
             except ValueError:
                 # If file is outside current directory, try limited pattern matching
                 return self._handle_external_file_matching(file_path, per_file_ignores)
         else:
             # File path is already relative, use it directly
-            return str(file_path)
+            return split_path(file_path)
 
-    def _handle_external_file_matching(self, file_path: Path, per_file_ignores: dict[str, Union[list[str], str]]) -> Optional[str]:
+    def _handle_external_file_matching(self, file_path: Path, per_file_ignores: dict[str, Union[list[str], str]]) -> Optional[tuple[str, ...]]:
         """Handle pattern matching for files outside project directory."""
         file_str = str(file_path)
 
@@ -369,15 +429,9 @@ class ConfigManager(IConfigManager):
                     # Find the index of the common directory and create subpath from there
                     try:
                         dir_index = parts.index(common_dir)
-                        subpath = "/".join(parts[dir_index:])
-                        file_ignores = []
-                        for pattern, ignores in per_file_ignores.items():
-                            if self._matches_file_pattern(subpath, pattern):
-                                if isinstance(ignores, list):
-                                    file_ignores.extend(ignores)
-                                elif isinstance(ignores, str):
-                                    file_ignores.append(ignores)
-                        if file_ignores:  # If we found matches with this subpath, use this subpath
+                        subpath = parts[dir_index:]
+                        # If we found matches with this subpath, use this subpath
+                        if self._collect_file_ignores(subpath, per_file_ignores):
                             return subpath
                     except ValueError:
                         continue
@@ -385,24 +439,87 @@ class ConfigManager(IConfigManager):
         # For files outside project and not in temp directories, return None
         return None
 
-    def _matches_file_pattern(self, file_path: str, pattern: str) -> bool:
-        """Check if a file path matches a pattern (ruff-like).
+    def _collect_file_ignores(
+        self, relative_parts: tuple[str, ...], per_file_ignores: dict[str, Union[list[str], str]]
+    ) -> list[str]:
+        """Collect ignored rules from every per_file_ignores pattern matching the path segments."""
+        ignore_trie = self._get_ignore_trie()
+        file_ignores: list[str] = []
+        for pattern_id in ignore_trie.match_parts(relative_parts):
+            ignores = per_file_ignores[ignore_trie.patterns[pattern_id]]
+            if isinstance(ignores, list):
+                file_ignores.extend(ignores)
+            elif isinstance(ignores, str):
+                file_ignores.append(ignores)
+        return file_ignores
 
-        Supports patterns like:
-        - "__init__.py" - exact file match
-        - "tests/**" - directory and all subdirectories
-        - "**/{tests,docs,tools}/*" - multiple directory patterns
-        """
-        import fnmatch
+    def _get_ignore_trie(self) -> GlobTrie:
+        """Get the per_file_ignores trie, compiling it on first use."""
+        self._sync_compiled_state()
+        if self._ignore_trie is None:
+            self._ignore_trie = GlobTrie(self._config.get("per_file_ignores", {}))
+        return self._ignore_trie
+
+    def _sync_compiled_state(self) -> None:
+        """Drop compiled structures if _config was replaced since they were built."""
+        if self._compiled_config is not self._config:
+            self._invalidate_compiled_patterns()
+            self._compiled_config = self._config
+
+    def _get_globally_enabled_rules(self) -> frozenset[str]:
+        """Get built-in rules enabled by select/ignore, resolving them on first use."""
+        self._sync_compiled_state()
+        if self._globally_enabled_rules is None:
+            self._globally_enabled_rules = frozenset(
+                rule_id
+                for rule_id in KNOWN_RULE_IDS
+                if self._matches_select_and_ignore(rule_id)
+            )
+        return self._globally_enabled_rules
+
+    def _invalidate_compiled_patterns(self) -> None:
+        """Drop compiled pattern structures after the configuration changed."""
+        self._ignore_trie = None
+        self._globally_enabled_rules = None
+        self._checker_config_cache.clear()
+        self._file_ignores_cache.clear()
+        self._effective_rules_cache.clear()
+
+    def effective_rules_for_file(self, file_path: Path) -> frozenset[str]:
+        """Get all built-in rules enabled for a given file path.
 
-        # Normalize path separators
-        file_path = file_path.replace("\\", "/")
-        pattern = pattern.replace("\\", "/")
+        select/ignore are resolved once per configuration; per_file_ignores
+        are then applied on top and the result is cached per path.
 
-        return fnmatch.fnmatch(file_path, pattern)
+        Args:
+            file_path: Path to the test file being analyzed
+
+        Returns:
+            Rule IDs from KNOWN_RULE_IDS that are enabled for this file
+
+        """
+        globally_enabled = self._get_globally_enabled_rules()
+        cache_key = self._file_cache_key(file_path)
+        effective_rules = self._effective_rules_cache.get(cache_key)
+        if effective_rules is None:
+            file_ignores = self.get_file_specific_ignores(file_path)
+            if file_ignores:
+                effective_rules = frozenset(
+                    rule_id
+                    for rule_id in globally_enabled
+                    if not self._matches_patterns(rule_id, file_ignores)
+                )
+            else:
+                effective_rules = globally_enabled
+            self._effective_rules_cache[cache_key] = effective_rules
+        return effective_rules
 
     def is_rule_enabled_for_file(self, rule_id: str, file_path: Path) -> bool:
         """Check if a specific rule is enabled for a given file path."""
+        if rule_id in _KNOWN_RULE_ID_SET:
+            return rule_id in self.effective_rules_for_file(file_path)
+
+        # Rules outside the built-in set are resolved directly
         # First check global rule enablement
         if not self.is_rule_enabled(rule_id):
             return False
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Any, Optional
 
 from pytestee.domain.interfaces import IChecker, ICheckerRegistry
+from pytestee.domain.rules import KNOWN_RULE_IDS
 
 if TYPE_CHECKING:
     from pytestee.domain.rules.base_rule import BaseRule
@@ -131,18 +132,8 @@ class CheckerRegistry(ICheckerRegistry):
                 "PTEC001", "PTEC002", "PTEC003", "PTEC004", "PTEC005"
             ]
 
-        all_possible_rules = [
-            "PTCM001", "PTCM002", "PTCM003",
-            "PTST001",
-            "PTLG001",
-            "PTAS001", "PTAS002", "PTAS003", "PTAS004", "PTAS005",
-            "PTNM001", "PTNM002", "PTNM003",
-            "PTVL001", "PTVL002", "PTVL003", "PTVL004", "PTVL005",
-            "PTEC001", "PTEC002", "PTEC003", "PTEC004", "PTEC005"
-        ]
-
         return [
-            rule_id for rule_id in all_possible_rules
+            rule_id for rule_id in KNOWN_RULE_IDS
             if self.config_manager.is_rule_enabled(rule_id)
         ]
 
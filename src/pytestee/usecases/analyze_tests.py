@@ -124,28 +124,34 @@ class AnalyzeTestsUseCase:
         # Get all rule instances from registry
         all_rule_instances = self._checker_registry.get_all_rule_instances()
 
-        # Run rules on each test function (with file-specific rule filtering)
-        for test_function in test_file.test_functions:
-            for rule_id, rule in all_rule_instances.items():
-                # Check if rule is enabled for this specific file
-                if rule.is_enabled_for_file(test_file, self._config_manager):
-                    try:
-                        # Use global checker config (no file-specific overrides needed)
-                        checker_config = self._config_manager.get_checker_config(rule.name)
-                        rule_result = rule.check(test_function, test_file, checker_config)
-                        results.append(rule_result)
-                    except Exception as e:
-                        # Log rule error and continue with other rules
-                        raise CheckerError(rule_id, e) from e
+        # Resolve file-specific rule enablement and checker config once per file
+        # instead of once per test function/class
+        enabled_rules = []
+        for rule_id, rule in all_rule_instances.items():
+            if not rule.is_enabled_for_file(test_file, self._config_manager):
+                continue
+            try:
+                # Use global checker config (no file-specific overrides needed)
+                checker_config = self._config_manager.get_checker_config(rule.name)
+            except Exception as e:
+                raise CheckerError(rule_id, e) from e
+            enabled_rules.append((rule_id, rule, checker_config))
 
-        # Run rules on each test class (with file-specific rule filtering)
+        # Run rules on each test function
+        for test_function in test_file.test_functions:
+            for rule_id, rule, checker_config in enabled_rules:
+                try:
+                    rule_result = rule.check(test_function, test_file, checker_config)
+                    results.append(rule_result)
+                except Exception as e:
+                    # Log rule error and continue with other rules
+                    raise CheckerError(rule_id, e) from e
+
+        # Run rules on each test class (only rules with check_class method)
         for test_class in test_file.test_classes:
-            for rule_id, rule in all_rule_instances.items():
-                # Check if rule is enabled for this specific file and has check_class method
-                if rule.is_enabled_for_file(test_file, self._config_manager) and hasattr(rule, 'check_class'):
+            for rule_id, rule, checker_config in enabled_rules:
+                if hasattr(rule, 'check_class'):
                     try:
-                        # Use global checker config (no file-specific overrides needed)
-                        checker_config = self._config_manager.get_checker_config(rule.name)
                         rule_result = rule.check_class(test_class, test_file, checker_config)
                         results.append(rule_result)
                     except Exception as e:
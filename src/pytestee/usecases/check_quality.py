@@ -80,11 +80,7 @@ class CheckQualityUseCase:
         test_file = self._test_repository.load_test_file(file_path)
 
         # Find the specific function
-        target_function = None
-        for test_function in test_file.test_functions:
-            if test_function.name == function_name:
-                target_function = test_function
-                break
+        target_function = test_file.functions_by_name.get(function_name)
 
         if not target_function:
             raise ValueError(
@@ -0,0 +1,87 @@
+"""Shared fixtures for integration tests."""
+
+from pathlib import Path
+
+import pytest
+
+from pytestee.adapters.repositories.file_repository import FileRepository
+from pytestee.domain.models import TestFile
+
+EXAMPLE_FILE_PATH = (
+    Path(__file__).resolve().parent.parent / "fixtures" / "test_example_patterns.py"
+)
+
+UNIT_TEST_CONTENT = b"""
+def test_unit_function():
+    # This test doesn't follow AAA pattern but should be ignored
+    value = 1
+    result = value + 1
+    assert result == 2
+"""
+
+INTEGRATION_TEST_CONTENT = b"""
+def test_integration_function():
+    # This test doesn't follow AAA pattern and should be flagged
+    value = 1
+    result = value + 1
+    assert result == 2
+"""
+
+CONFTEST_CONTENT = b"""
+# This file has no test functions but might trigger naming rules
+def helper_function():
+    pass
+"""
+
+PER_FILE_IGNORES_CONFIG = b"""
+# Global configuration - enable strict rules
+select = ["PTCM001", "PTAS005"]
+
+[rules.PTCM001]
+require_comments = true
+
+[rules.PTAS005]
+min_asserts = 1
+max_asserts = 3
+
+# Per-file ignores (ruff-like)
+[per_file_ignores]
+"tests/unit/**" = ["PTCM001"]  # Ignore comment requirements in unit tests
+"**/conftest.py" = ["PTCM001", "PTAS005"]  # Ignore multiple rules in conftest files
+"""
+
+
+@pytest.fixture(scope="session")
+def unit_integration_layout(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a read-only project with unit/integration tests and per-file ignores.
+
+    Layout::
+
+        .pytestee.toml
+        tests/unit/test_unit_example.py
+        tests/unit/conftest.py
+        tests/integration/test_integration_example.py
+
+    Tests that need to modify the tree should copy it into their own tmp_path.
+    """
+    root = tmp_path_factory.mktemp("unit_integration_layout")
+
+    unit_dir = root / "tests" / "unit"
+    integration_dir = root / "tests" / "integration"
+    unit_dir.mkdir(parents=True)
+    integration_dir.mkdir(parents=True)
+
+    (unit_dir / "test_unit_example.py").write_bytes(UNIT_TEST_CONTENT)
+    (unit_dir / "conftest.py").write_bytes(CONFTEST_CONTENT)
+    (integration_dir / "test_integration_example.py").write_bytes(
+        INTEGRATION_TEST_CONTENT
+    )
+    (root / ".pytestee.toml").write_bytes(PER_FILE_IGNORES_CONFIG)
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def example_test_file() -> TestFile:
+    """Load and parse the RULES.md example file once per session (or xdist worker)."""
+    return FileRepository().load_test_file(EXAMPLE_FILE_PATH)
@@ -2,38 +2,65 @@
 
 from pathlib import Path
 
+import pytest
+
 from pytestee.domain.analyzers.pattern_analyzer import PatternAnalyzer
-from pytestee.domain.models import CheckFailure, CheckSeverity, CheckSuccess
+from pytestee.domain.models import (
+    CheckFailure,
+    CheckResult,
+    CheckSeverity,
+    CheckSuccess,
+)
 from pytestee.domain.rules.naming.japanese_characters import PTNM001
 from pytestee.infrastructure.ast_parser import ASTParser
 
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def _partition_results(
+    results: list[CheckResult],
+) -> tuple[list[CheckSuccess], list[CheckFailure]]:
+    """Split results into successes and failures in a single pass."""
+    successes: list[CheckSuccess] = []
+    failures: list[CheckFailure] = []
+    for result in results:
+        if isinstance(result, CheckSuccess):
+            successes.append(result)
+        else:
+            failures.append(result)
+    return successes, failures
+
+
+@pytest.fixture(scope="module")
+def parsed_results() -> tuple[list[CheckResult], Path]:
+    """Parse the fixture file and run the checker once for the whole module."""
+    parser = ASTParser()
+    checker = PTNM001(PatternAnalyzer())
+    test_file_path = FIXTURES_DIR / "japanese_naming_test.py"
+    test_file = parser.parse_file(test_file_path)
+
+    results = [
+        checker.check(test_function, test_file)
+        for test_function in test_file.test_functions
+    ]
+    return results, test_file_path
+
 
 class TestJapaneseNamingIntegration:
     """Integration tests for Japanese naming rule functionality."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.parser = ASTParser()
-        self.checker = PTNM001(PatternAnalyzer())
-        self.fixtures_dir = Path(__file__).parent.parent / "fixtures"
-
-    def test_japanese_naming_rule_with_real_file(self) -> None:
+    def test_japanese_naming_rule_with_real_file(
+        self, parsed_results: tuple[list[CheckResult], Path]
+    ) -> None:
         """Test Japanese naming rule with real test file."""
-        test_file_path = self.fixtures_dir / "japanese_naming_test.py"
-        test_file = self.parser.parse_file(test_file_path)
-
-        # Collect results for all test functions
-        results = []
-        for test_function in test_file.test_functions:
-            function_result = self.checker.check(test_function, test_file)
-            results.append(function_result)
+        results, _ = parsed_results
 
         # Should have results for all test methods (6 test methods total)
         assert len(results) == 6
 
         # Count results by type
-        success_results = [r for r in results if isinstance(r, CheckSuccess)]
-        failure_results = [r for r in results if isinstance(r, CheckFailure) and r.severity == CheckSeverity.ERROR]
+        success_results, all_failures = _partition_results(results)
+        failure_results = [r for r in all_failures if r.severity is CheckSeverity.ERROR]
 
         # Japanese methods should return INFO (4 methods: 日本語, ひらがな, カタカナ, 漢字)
         # Mixed method should return INFO (1 method: mixed_japanese)
@@ -49,40 +76,33 @@ class TestJapaneseNamingIntegration:
             "test_漢字を含むテスト",
             "test_mixed_japanese_englishテスト",
         ]
-        english_methods = ["test_english_only_method"]
+        english_method = "test_english_only_method"
 
-        success_function_names = {r.function_name for r in success_results}
-        failure_function_names = {r.function_name for r in failure_results}
+        results_by_name = {r.function_name: r for r in results}
 
-        assert success_function_names == set(japanese_methods)
-        assert failure_function_names == set(english_methods)
+        assert set(results_by_name) == {*japanese_methods, english_method}
+        for method_name in japanese_methods:
+            assert isinstance(results_by_name[method_name], CheckSuccess)
+        english_result = results_by_name[english_method]
+        assert isinstance(english_result, CheckFailure)
+        assert english_result.severity is CheckSeverity.ERROR
 
-    def test_rule_id_consistency(self) -> None:
+    def test_rule_id_consistency(
+        self, parsed_results: tuple[list[CheckResult], Path]
+    ) -> None:
         """Test that all results have consistent rule ID."""
-        test_file_path = self.fixtures_dir / "japanese_naming_test.py"
-        test_file = self.parser.parse_file(test_file_path)
-
-        # Collect results for all test functions
-        results = []
-        for test_function in test_file.test_functions:
-            function_result = self.checker.check(test_function, test_file)
-            results.append(function_result)
+        results, _ = parsed_results
 
         # All results should have PTNM001 rule ID
         for result in results:
             assert result.rule_id == "PTNM001"
             assert result.checker_name == "japanese_characters_in_name"
 
-    def test_line_number_accuracy(self) -> None:
+    def test_line_number_accuracy(
+        self, parsed_results: tuple[list[CheckResult], Path]
+    ) -> None:
         """Test that line numbers are accurately reported."""
-        test_file_path = self.fixtures_dir / "japanese_naming_test.py"
-        test_file = self.parser.parse_file(test_file_path)
-
-        # Collect results for all test functions
-        results = []
-        for test_function in test_file.test_functions:
-            function_result = self.checker.check(test_function, test_file)
-            results.append(function_result)
+        results, test_file_path = parsed_results
 
         # All results should have valid line numbers
         for result in results:
@@ -90,19 +110,14 @@ class TestJapaneseNamingIntegration:
             assert result.line_number > 0
             assert result.file_path == test_file_path
 
-    def test_message_content(self) -> None:
+    def test_message_content(
+        self, parsed_results: tuple[list[CheckResult], Path]
+    ) -> None:
         """Test that messages contain appropriate content."""
-        test_file_path = self.fixtures_dir / "japanese_naming_test.py"
-        test_file = self.parser.parse_file(test_file_path)
-
-        # Collect results for all test functions
-        results = []
-        for test_function in test_file.test_functions:
-            function_result = self.checker.check(test_function, test_file)
-            results.append(function_result)
+        results, _ = parsed_results
 
-        success_results_check = [r for r in results if isinstance(r, CheckSuccess)]
-        failure_results_check = [r for r in results if isinstance(r, CheckFailure) and r.severity == CheckSeverity.WARNING]
+        success_results_check, all_failures = _partition_results(results)
+        failure_results_check = [r for r in all_failures if r.severity is CheckSeverity.WARNING]
 
         # INFO messages should mention Japanese characters are included
         for result in success_results_check:
@@ -1,5 +1,7 @@
 """Unit tests for FileRepository."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -53,6 +55,58 @@ class TestFileRepository:
             # Should exclude conftest.py and test_skip_*.py but include all other .py files
             assert file_names == ["test_example.py"]
 
+    def test_find_test_files_prunes_excluded_directories(self) -> None:
+        """Test that directories covered by a "dir/**" exclude are not walked."""
+        with TemporaryDirectory() as tmpdir:
+            test_dir = Path(tmpdir)
+            (test_dir / "tests").mkdir()
+            (test_dir / "tests" / "test_example.py").write_text("def test_example(): pass")
+            (test_dir / "tests" / "fixtures").mkdir()
+            (test_dir / "tests" / "fixtures" / "test_data.py").write_text("def test_data(): pass")
+
+            repo = FileRepository(exclude_patterns=["**/fixtures/**"])
+            walked = repo._walk_python_files(test_dir)
+            result = repo.find_test_files(test_dir)
+
+            assert [f.name for f in walked] == ["test_example.py"]
+            assert [f.name for f in result] == ["test_example.py"]
+
+    def test_find_test_files_skips_unreadable_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a directory that cannot be listed does not abort the walk."""
+        (tmp_path / "private").mkdir()
+        (tmp_path / "private" / "test_hidden.py").write_text("def test_hidden(): pass")
+        (tmp_path / "test_visible.py").write_text("def test_visible(): pass")
+        real_scandir = os.scandir
+
+        def scandir(path: Path) -> Iterator[os.DirEntry[str]]:
+            if Path(path).name == "private":
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        result = self.repo.find_test_files(tmp_path)
+
+        assert [f.name for f in result] == ["test_visible.py"]
+
+    def test_find_test_files_exclude_wildcard_crosses_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that * in exclude patterns matches nested paths like fnmatch."""
+        (tmp_path / "tests" / "legacy" / "sub").mkdir(parents=True)
+        (tmp_path / "tests" / "test_main.py").write_text("def test_main(): pass")
+        (tmp_path / "tests" / "legacy" / "test_a.py").write_text("def test_a(): pass")
+        (tmp_path / "tests" / "legacy" / "sub" / "test_b.py").write_text("def test_b(): pass")
+        monkeypatch.chdir(tmp_path)
+
+        for pattern in ("tests/legacy/*", "*legacy*"):
+            repo = FileRepository(exclude_patterns=[pattern])
+            result = repo.find_test_files(Path("tests"))
+
+            assert result == [Path("tests/test_main.py")]
+
     def test_find_test_files_with_file_path(self) -> None:
         """Test finding test files when given a file path."""
         # Create temporary test files
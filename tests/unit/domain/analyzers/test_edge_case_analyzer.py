@@ -0,0 +1,45 @@
+"""Unit tests for EdgeCaseAnalyzer."""
+
+import ast
+
+from pytestee.domain.analyzers.edge_case_analyzer import EdgeCaseAnalyzer, EdgeCaseType
+from pytestee.domain.models import TestFunction
+
+
+class TestEdgeCaseAnalyzerClassification:
+    """Test cases for value classification."""
+
+    def test_non_ascii_strings_are_unicode_edge_cases(self) -> None:
+        """Test that any non-ASCII character marks a string as a unicode edge case."""
+        assert EdgeCaseAnalyzer._classify_value("ユーザー") == [
+            EdgeCaseType.STRING_UNICODE
+        ]
+        assert EdgeCaseAnalyzer._classify_value("café") == [EdgeCaseType.STRING_UNICODE]
+        assert EdgeCaseAnalyzer._classify_value("plain") == []
+
+    def test_unicode_pattern_predicate(self) -> None:
+        """Test the STRING_UNICODE pattern predicate."""
+        is_unicode = EdgeCaseAnalyzer.STRING_EDGE_PATTERNS[EdgeCaseType.STRING_UNICODE]
+
+        assert is_unicode("日本語")
+        assert not is_unicode("ascii only")
+        assert not is_unicode(123)
+
+
+class TestEdgeCaseAnalyzerMissingCases:
+    """Test cases for missing edge case reporting."""
+
+    def test_missing_numeric_edge_cases_in_report_order(self) -> None:
+        """Test that covered types are dropped and the rest keep their order."""
+        test_function = TestFunction(
+            name="test_zero",
+            lineno=1,
+            col_offset=0,
+            end_lineno=2,
+            end_col_offset=0,
+            body=ast.parse("value = 0\nassert value == 0").body,
+        )
+
+        missing = EdgeCaseAnalyzer.get_missing_numeric_edge_cases(test_function)
+
+        assert missing == [EdgeCaseType.NUMERIC_NEGATIVE, EdgeCaseType.NUMERIC_MAX_MIN]
@@ -0,0 +1,62 @@
+"""Unit tests for PatternAnalyzer."""
+
+from unittest.mock import patch
+
+from pytestee.domain.analyzers.pattern_analyzer import PatternAnalyzer
+from pytestee.domain.models import TestFunction
+
+GWT_CONTENT = """def test_gwt_pattern():
+    # GIVEN a value
+    x = 1
+    # When it is incremented
+    result = x + 1
+    # then it grows
+    assert result == 2"""
+
+
+def _make_function(end_lineno: int) -> TestFunction:
+    """Create a test function spanning the first end_lineno lines."""
+    return TestFunction(
+        name="test_gwt_pattern",
+        lineno=1,
+        col_offset=0,
+        end_lineno=end_lineno,
+        end_col_offset=0,
+        body=[],
+    )
+
+
+class TestPatternAnalyzerComments:
+    """Test cases for AAA/GWT comment detection."""
+
+    def test_keywords_match_case_insensitively(self) -> None:
+        """Test that mixed-case comment keywords are recognized."""
+        test_function = _make_function(7)
+
+        assert PatternAnalyzer.find_gwt_comments(test_function, GWT_CONTENT)
+        assert not PatternAnalyzer.find_aaa_comments(test_function, GWT_CONTENT)
+
+    def test_aaa_or_gwt_extracts_comments_once(self) -> None:
+        """Test that the combined check scans the function's comments only once."""
+        test_function = _make_function(7)
+
+        with patch.object(
+            PatternAnalyzer,
+            "_extract_comments",
+            wraps=PatternAnalyzer._extract_comments,
+        ) as extract_comments:
+            result = PatternAnalyzer.find_aaa_or_gwt_comments(
+                test_function, GWT_CONTENT
+            )
+
+        assert result == (True, "GWT")
+        assert extract_comments.call_count == 1
+
+    def test_missing_keyword_is_not_a_pattern(self) -> None:
+        """Test that a partial keyword set is rejected."""
+        test_function = _make_function(5)
+
+        assert PatternAnalyzer.find_aaa_or_gwt_comments(test_function, GWT_CONTENT) == (
+            False,
+            None,
+        )
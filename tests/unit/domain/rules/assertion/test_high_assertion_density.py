@@ -387,3 +387,34 @@ class TestPTAS003:
         assert isinstance(result, CheckFailure)
         assert "High assertion density: 0.75" in result.message
         assert "3 assertions in 4 lines" in result.message
+
+    def test_precomputed_effective_line_count_is_used(self) -> None:
+        """Test that a parser-supplied line count is used without re-reading content."""
+        test_file = TestFile(
+            path=Path("/test/dummy.py"),
+            content="",
+            ast_tree=ast.parse(""),
+            test_functions=[],
+            test_classes=[],
+        )
+
+        body = [
+            ast.Assert(test=ast.Constant(value=True), msg=None),
+        ]
+
+        test_function = TestFunction(
+            name="test_precomputed",
+            lineno=1,
+            col_offset=0,
+            end_lineno=5,
+            end_col_offset=0,
+            body=body,
+            decorators=[],
+            docstring=None,
+            effective_line_count=4,
+        )
+
+        result = self.rule.check(test_function, test_file)
+
+        assert isinstance(result, CheckSuccess)
+        assert "1 assertions in 4 lines" in result.message
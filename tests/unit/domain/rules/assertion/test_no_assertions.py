@@ -165,6 +165,13 @@ class TestPTAS004:
         expected = {"PTAS001", "PTAS002", "PTAS005"}
         assert conflicting == expected
 
+    def test_conflicting_rules_are_shared_and_immutable(self) -> None:
+        """Test that the conflict set is a constant rather than rebuilt per call."""
+        conflicting = self.rule.get_conflicting_rules()
+
+        assert isinstance(conflicting, frozenset)
+        assert self.rule.get_conflicting_rules() is conflicting
+
     def test_result_contains_correct_metadata(self) -> None:
         """Test that results contain correct metadata."""
         body: list[ast.stmt] = [ast.Expr(value=ast.Constant(value="no assertions"))]
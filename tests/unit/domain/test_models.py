@@ -0,0 +1,107 @@
+"""Unit tests for domain models."""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+from pytestee.domain.models import CheckFailure, CheckSuccess, TestFile, TestFunction
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+)
+class TestModelSlots:
+    """Test that bulk-created models are slotted."""
+
+    def test_test_function_has_no_instance_dict(self) -> None:
+        """Test that TestFunction stores its fields in slots."""
+        test_function = TestFunction(
+            name="test_example",
+            lineno=1,
+            col_offset=0,
+            end_lineno=None,
+            end_col_offset=None,
+            body=[],
+        )
+
+        assert not hasattr(test_function, "__dict__")
+        assert test_function.decorators == []
+
+    def test_test_file_has_no_instance_dict(self) -> None:
+        """Test that TestFile stores its fields in slots."""
+        test_file = TestFile(
+            path=Path("test_example.py"),
+            content="",
+            ast_tree=ast.parse(""),
+            test_functions=[],
+            test_classes=[],
+        )
+
+        assert not hasattr(test_file, "__dict__")
+        assert test_file.relative_path == "test_example.py"
+
+    def test_check_results_have_no_instance_dict(self) -> None:
+        """Test that slotted result subclasses keep their own and base fields."""
+        success = CheckSuccess(
+            checker_name="checker",
+            rule_id="PTCM001",
+            message="ok",
+            file_path=Path("test_example.py"),
+        )
+        failure = CheckFailure(
+            checker_name="checker",
+            rule_id="PTCM001",
+            message="ng",
+            file_path=Path("test_example.py"),
+        )
+
+        assert not hasattr(success, "__dict__")
+        assert not hasattr(failure, "__dict__")
+        assert success.context == {}
+        assert failure.context == {}
+
+
+class TestTestFile:
+    """Test cases for TestFile."""
+
+    def test_functions_by_name_is_built_once(self) -> None:
+        """Test that name lookup is memoized and prefers the first definition."""
+        first = TestFunction(
+            name="test_dup",
+            lineno=1,
+            col_offset=0,
+            end_lineno=None,
+            end_col_offset=None,
+            body=[],
+        )
+        second = TestFunction(
+            name="test_dup",
+            lineno=5,
+            col_offset=0,
+            end_lineno=None,
+            end_col_offset=None,
+            body=[],
+        )
+        other = TestFunction(
+            name="test_other",
+            lineno=9,
+            col_offset=0,
+            end_lineno=None,
+            end_col_offset=None,
+            body=[],
+        )
+        test_file = TestFile(
+            path=Path("test_example.py"),
+            content="",
+            ast_tree=ast.parse(""),
+            test_functions=[first, second, other],
+            test_classes=[],
+        )
+
+        functions = test_file.functions_by_name
+
+        assert functions == {"test_dup": first, "test_other": other}
+        assert test_file.functions_by_name is functions
+        assert test_file.functions_by_name.get("test_missing") is None
@@ -0,0 +1,130 @@
+"""Unit tests for GlobTrie."""
+
+import fnmatch
+from pathlib import PurePosixPath, PureWindowsPath
+
+import pytest
+
+from pytestee.infrastructure.config.glob_trie import GlobTrie, split_path
+
+
+class TestGlobTrie:
+    """Test cases for GlobTrie."""
+
+    def test_literal_pattern(self) -> None:
+        """Test exact file path patterns."""
+        trie = GlobTrie(["__init__.py", "tests/unit/test_example.py"])
+
+        assert trie.match("__init__.py") == (0,)
+        assert trie.match("tests/unit/test_example.py") == (1,)
+        assert trie.match("tests/unit/test_other.py") == ()
+
+    def test_globstar_matches_any_depth(self) -> None:
+        """Test that ** matches files in every subdirectory."""
+        trie = GlobTrie(["tests/**", "**/__init__.py"])
+
+        assert trie.match("tests/unit/deep/test_file.py") == (0,)
+        assert trie.match("src/pkg/__init__.py") == (1,)
+        assert trie.match("tests/__init__.py") == (0, 1)
+        assert trie.match("src/main.py") == ()
+
+    def test_wildcard_crosses_directory_boundaries(self) -> None:
+        """Test that * keeps fnmatch semantics and also matches "/"."""
+        trie = GlobTrie(["tests/*", "*.py", "**/docs/*", "*legacy*"])
+
+        assert trie.match("tests/unit/test_x.py") == (0, 1)
+        assert trie.match("project/docs/api/index.py") == (1, 2)
+        assert trie.match("src/legacy/old.py") == (1, 3)
+        assert trie.match("tests") == ()
+
+    @pytest.mark.parametrize(
+        "pattern_and_path",
+        [
+            ("tests/*", "tests/unit/test_x.py"),
+            ("tests/*", "tests"),
+            ("**/__init__.py", "__init__.py"),
+            ("**/test_*.py", "src/tests/unit/test_file.py"),
+            ("tests/unit/**/test_*.py", "tests/unit/test_file.py"),
+            ("tests/unit/**/test_*.py", "tests/unit/deep/test_file.py"),
+            ("*/legacy/*", "tests/legacy/sub/test_b.py"),
+            ("test_?.py", "tests/test_a.py"),
+            ("[st]*/*.py", "src/pkg/mod.py"),
+        ],
+    )
+    def test_matches_like_fnmatch(self, pattern_and_path: tuple[str, str]) -> None:
+        """Test that the trie agrees with fnmatch on the whole path."""
+        pattern, path = pattern_and_path
+        trie = GlobTrie([pattern])
+
+        assert bool(trie.match(path)) == fnmatch.fnmatchcase(path, pattern)
+
+    def test_per_file_ignore_patterns(self) -> None:
+        """Test the pattern forms documented for per_file_ignores."""
+        # Exact file match
+        assert GlobTrie(["__init__.py"]).match("__init__.py")
+        assert not GlobTrie(["__init__.py"]).match("test.py")
+
+        # Directory wildcard
+        trie = GlobTrie(["tests/**"])
+        assert trie.match("tests/unit/test_file.py")
+        assert trie.match("tests/integration/deep/test_file.py")
+        assert not trie.match("src/main.py")
+
+        # Any directory pattern with filename
+        trie = GlobTrie(["**/test_*.py"])
+        assert trie.match("src/tests/unit/test_file.py")
+        assert trie.match("tests/test_file.py")
+        assert not trie.match("tests/main.py")
+
+        # Any directory pattern with specific file
+        trie = GlobTrie(["**/__init__.py"])
+        assert trie.match("src/mymodule/__init__.py")
+        assert trie.match("tests/unit/__init__.py")
+
+    def test_windows_separators_are_normalized(self) -> None:
+        """Test that backslash separators match like forward slashes."""
+        trie = GlobTrie(["tests/unit/**"])
+
+        assert trie.match("tests\\unit\\test_file.py") == (0,)
+
+    def test_literal_prefix_before_wildcards(self) -> None:
+        """Test patterns whose leading segments are literal directories."""
+        trie = GlobTrie(["tests/unit/**", "tests/unit/test_*.py", "docs/index.py"])
+
+        assert trie.match("tests/unit/test_file.py") == (0, 1)
+        assert trie.match("tests/unit/deep/helper.py") == (0,)
+        assert trie.match("tests/unitx/test_file.py") == ()
+        assert trie.match("tests") == ()
+        assert trie.match("docs/index.py") == (2,)
+        assert trie.match("docs/index.py/extra") == ()
+
+    def test_match_parts_agrees_with_match(self) -> None:
+        """Test that pre-split paths match like their string form."""
+        trie = GlobTrie(["tests/unit/**", "**/conftest.py", ".venv/**"])
+
+        for path in (
+            PurePosixPath("tests/unit/deep/test_file.py"),
+            PurePosixPath("/project/src/conftest.py"),
+            PureWindowsPath("C:/project/tests/unit/test_file.py"),
+            PurePosixPath("src/main.py"),
+        ):
+            assert trie.match_parts(split_path(path)) == trie.match(path.as_posix())
+
+        assert trie.covers_directory_parts(split_path(PurePosixPath(".venv")))
+        assert not trie.covers_directory_parts(split_path(PurePosixPath("tests")))
+
+    def test_covers_directory_only_for_globstar_suffix(self) -> None:
+        """Test that only "<prefix>/**" patterns cover whole directories."""
+        trie = GlobTrie(["*legacy*", "tests/fixtures/*", "**/build/**"])
+
+        assert not trie.covers_directory("src/legacy")
+        assert not trie.covers_directory("tests/fixtures")
+        assert trie.covers_directory("project/build")
+        assert not trie.covers_directory("build")
+
+    def test_many_stars_do_not_backtrack_catastrophically(self) -> None:
+        """Test that multi-star segments fail fast on long non-matching names."""
+        trie = GlobTrie(["**/*a*a*a*a*a*a*a*a*b.py"])
+
+        assert trie.match("src/" + "a" * 5000 + ".py") == ()
+        assert trie.match("src/" + "a" * 50 + "b.py") == (0,)
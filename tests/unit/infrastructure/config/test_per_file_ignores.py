@@ -3,6 +3,9 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from pytestee.domain.rules import KNOWN_RULE_IDS
 from pytestee.infrastructure.config.settings import ConfigManager
 
 
@@ -69,6 +72,21 @@ class TestPerFileIgnores:
         result = config_manager.get_file_specific_ignores(docs_file)
         assert result == ["PTAS005"]
 
+    def test_get_file_specific_ignores_wildcard_crosses_directories(self) -> None:
+        """Test that * matches across directories like fnmatch."""
+        config_manager = ConfigManager()
+        config_manager._config = {
+            "per_file_ignores": {
+                "tests/*": ["PTCM001"],
+                "*.py": ["PTAS005"]
+            }
+        }
+
+        file_path = Path("tests/unit/test_x.py")
+        result = config_manager.get_file_specific_ignores(file_path)
+
+        assert result == ["PTCM001", "PTAS005"]
+
     def test_get_file_specific_ignores_string_input(self) -> None:
         """Test file-specific ignores with string input (not list)."""
         config_manager = ConfigManager()
@@ -86,28 +104,6 @@ class TestPerFileIgnores:
         assert "PTCM001" in result
         assert "PTAS005" in result
 
-    def test_matches_file_pattern_various_patterns(self) -> None:
-        """Test file pattern matching with various patterns."""
-        config_manager = ConfigManager()
-
-        # Exact file match
-        assert config_manager._matches_file_pattern("__init__.py", "__init__.py")
-        assert not config_manager._matches_file_pattern("test.py", "__init__.py")
-
-        # Directory wildcard
-        assert config_manager._matches_file_pattern("tests/unit/test_file.py", "tests/**")
-        assert config_manager._matches_file_pattern("tests/integration/deep/test_file.py", "tests/**")
-        assert not config_manager._matches_file_pattern("src/main.py", "tests/**")
-
-        # Any directory pattern with filename
-        assert config_manager._matches_file_pattern("src/tests/unit/test_file.py", "**/test_*.py")
-        assert config_manager._matches_file_pattern("tests/test_file.py", "**/test_*.py")
-        assert not config_manager._matches_file_pattern("tests/main.py", "**/test_*.py")
-
-        # Any directory pattern with specific file
-        assert config_manager._matches_file_pattern("src/mymodule/__init__.py", "**/__init__.py")
-        assert config_manager._matches_file_pattern("tests/unit/__init__.py", "**/__init__.py")
-
     def test_is_rule_enabled_for_file_with_ignores(self) -> None:
         """Test rule enablement check with file-specific ignores."""
         config_manager = ConfigManager()
@@ -186,3 +182,99 @@ class TestPerFileIgnores:
         result = config_manager.get_file_specific_ignores(outside_file)
         assert result == []  # Should not match pattern
 
+    def test_get_file_specific_ignores_with_project_root(self) -> None:
+        """Test that absolute paths are matched relative to an explicit project root."""
+        config_manager = ConfigManager()
+        config_manager._config = {
+            "per_file_ignores": {
+                "tests/unit/**": ["PTCM001"]
+            }
+        }
+        config_manager.set_project_root(Path("/other/project"))
+
+        inside_file = Path("/other/project/tests/unit/test_example.py")
+        assert config_manager.get_file_specific_ignores(inside_file) == ["PTCM001"]
+
+        outside_file = Path("/elsewhere/tests/unit/test_example.py")
+        assert config_manager.get_file_specific_ignores(outside_file) == []
+
+    def test_effective_rules_for_file(self) -> None:
+        """Test the bulk effective rule set for a file path."""
+        config_manager = ConfigManager()
+        config_manager._config = {
+            "select": ["PTCM", "PTAS005"],
+            "ignore": ["PTCM002"],
+            "per_file_ignores": {
+                "tests/unit/**": ["PTCM001"],
+            }
+        }
+
+        unit_file = Path("tests/unit/test_example.py")
+        assert config_manager.effective_rules_for_file(unit_file) == {"PTCM003", "PTAS005"}
+
+        other_file = Path("tests/integration/test_example.py")
+        assert config_manager.effective_rules_for_file(other_file) == {"PTCM001", "PTCM003", "PTAS005"}
+
+        # Cache is dropped when the configuration changes
+        config_manager.set_config("ignore", [])
+        assert config_manager.effective_rules_for_file(unit_file) == {"PTCM002", "PTCM003", "PTAS005"}
+
+    def test_select_ignore_resolved_once_per_config(self) -> None:
+        """Test that select/ignore are resolved once and reused across files."""
+        config_manager = ConfigManager()
+        config_manager._config = {"select": ["PTAS"], "ignore": ["PTAS001"]}
+
+        with patch.object(
+            config_manager,
+            "_matches_select_and_ignore",
+            wraps=config_manager._matches_select_and_ignore,
+        ) as mock_matches:
+            config_manager.effective_rules_for_file(Path("tests/test_a.py"))
+            calls_after_first_file = mock_matches.call_count
+            config_manager.effective_rules_for_file(Path("tests/test_b.py"))
+
+        assert calls_after_first_file == len(KNOWN_RULE_IDS)
+        assert mock_matches.call_count == calls_after_first_file
+        assert config_manager.effective_rules_for_file(Path("tests/test_c.py")) == {
+            "PTAS002", "PTAS003", "PTAS004", "PTAS005"
+        }
+
+    def test_file_specific_ignores_cached_per_path(self) -> None:
+        """Test that per-file ignores are resolved once per path and configuration."""
+        config_manager = ConfigManager()
+        config_manager._config = {"per_file_ignores": {"tests/**": ["CUSTOM"]}}
+        file_path = Path("tests/test_example.py")
+
+        with patch.object(
+            config_manager,
+            "_collect_file_ignores",
+            wraps=config_manager._collect_file_ignores,
+        ) as mock_collect:
+            assert not config_manager.is_rule_enabled_for_file("CUSTOM001", file_path)
+            assert not config_manager.is_rule_enabled_for_file("CUSTOM002", file_path)
+            assert mock_collect.call_count == 1
+
+            config_manager.set_config("per_file_ignores", {"docs/**": ["CUSTOM"]})
+            assert config_manager.is_rule_enabled_for_file("CUSTOM001", file_path)
+            assert mock_collect.call_count == 2
+
+    def test_file_specific_ignores_follow_working_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cached ignores are not reused after the working directory changes."""
+        config_manager = ConfigManager()
+        config_manager._config = {"per_file_ignores": {"unit/**": ["PTCM001"]}}
+        file_path = tmp_path / "tests" / "unit" / "test_example.py"
+
+        monkeypatch.chdir(tmp_path)
+        assert config_manager.get_file_specific_ignores(file_path) == []
+
+        (tmp_path / "tests").mkdir()
+        monkeypatch.chdir(tmp_path / "tests")
+        assert config_manager.get_file_specific_ignores(file_path) == ["PTCM001"]
+
+        config_manager.set_project_root(tmp_path)
+        assert config_manager.get_file_specific_ignores(file_path) == []
+
+        config_manager.set_project_root(None)
+        assert config_manager.get_file_specific_ignores(file_path) == ["PTCM001"]
@@ -1,7 +1,6 @@
 """Unit tests for ConfigManager."""
 
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from pytestee.infrastructure.config.settings import ConfigManager
 
@@ -20,51 +19,49 @@ class TestConfigManager:
         patterns = self.config_manager.get_exclude_patterns()
         assert patterns == [".venv/**", "venv/**", "**/__pycache__/**"]
 
-    def test_load_config_with_exclude(self) -> None:
+    def test_load_config_with_exclude(self, tmp_path: Path) -> None:
         """Test loading configuration with exclude patterns."""
         config_content = """
 exclude = ["**/conftest.py", "test_skip_*.py", "**/fixtures/**"]
 """
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(config_content)
 
-        with NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write(config_content)
-            config_path = Path(f.name)
+        self.config_manager.load_config(config_path)
 
-        try:
-            self.config_manager.load_config(config_path)
+        # Check exclude patterns
+        exclude_patterns = self.config_manager.get_exclude_patterns()
+        assert exclude_patterns == ["**/conftest.py", "test_skip_*.py", "**/fixtures/**"]
 
-            # Check exclude patterns
-            exclude_patterns = self.config_manager.get_exclude_patterns()
-            assert exclude_patterns == ["**/conftest.py", "test_skip_*.py", "**/fixtures/**"]
+    def test_cached_toml_is_not_shared_between_loads(self, tmp_path: Path) -> None:
+        """Test that reloading identical TOML content yields an independent config."""
+        config_content = """
+exclude = ["**/fixtures/**"]
+"""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(config_content)
+
+        self.config_manager.load_config(config_path)
+        self.config_manager.get_exclude_patterns().append("mutated/**")
 
-        finally:
-            config_path.unlink()
+        other_manager = ConfigManager()
+        other_manager.load_config(config_path)
 
+        assert other_manager.get_exclude_patterns() == ["**/fixtures/**"]
 
-    def test_pyproject_toml_format(self) -> None:
+    def test_pyproject_toml_format(self, tmp_path: Path) -> None:
         """Test loading from pyproject.toml format."""
         config_content = """
 [tool.pytestee]
 exclude = ["skip_*.py"]
 """
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text(config_content)
 
-        with NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write(config_content)
-            config_path = Path(f.name)
-
-        try:
-            # Simulate pyproject.toml by renaming
-            pyproject_path = config_path.parent / "pyproject.toml"
-            config_path.rename(pyproject_path)
-
-            self.config_manager.load_config(pyproject_path)
-
-            exclude_patterns = self.config_manager.get_exclude_patterns()
-            assert exclude_patterns == ["skip_*.py"]
+        self.config_manager.load_config(pyproject_path)
 
-        finally:
-            if pyproject_path.exists():
-                pyproject_path.unlink()
+        exclude_patterns = self.config_manager.get_exclude_patterns()
+        assert exclude_patterns == ["skip_*.py"]
 
     def test_apply_overrides(self) -> None:
         """Test applying configuration overrides."""
@@ -125,3 +122,54 @@ exclude = ["skip_*.py"]
         assert self.config_manager.is_rule_enabled("PTCM003") is True
         # Non-PTCM rules should be disabled
         assert self.config_manager.is_rule_enabled("PTST001") is False
+
+    def test_checker_config_cached_until_config_changes(self) -> None:
+        """Test that checker configs are reused until the configuration changes."""
+        self.config_manager.load_config()
+
+        first = self.config_manager.get_checker_config("PTAS005")
+        assert self.config_manager.get_checker_config("PTAS005") is first
+        assert first.config == {"max_asserts": 3, "min_asserts": 1}
+
+        self.config_manager.apply_overrides({"rules": {"PTAS005": {"max_asserts": 5}}})
+
+        updated = self.config_manager.get_checker_config("PTAS005")
+        assert updated is not first
+        assert updated.config == {"max_asserts": 5}
+
+    def test_loaded_rule_config_does_not_leak_into_defaults(self, tmp_path: Path) -> None:
+        """Test that merging a config file leaves the default rule settings intact."""
+        custom_path = tmp_path / "custom.toml"
+        custom_path.write_text("[rules.PTAS005]\nmax_asserts = 10\n")
+        plain_path = tmp_path / "plain.toml"
+        plain_path.write_text('ignore = ["PTAS001"]\n')
+
+        self.config_manager.load_config(custom_path)
+        assert self.config_manager.get_checker_config("PTAS005").config == {
+            "max_asserts": 10,
+            "min_asserts": 1,
+        }
+
+        self.config_manager.load_config(plain_path)
+        assert self.config_manager.get_checker_config("PTAS005").config == {
+            "max_asserts": 3,
+            "min_asserts": 1,
+        }
+
+    def test_rule_pattern_matching(self) -> None:
+        """Test exact and prefix matching of rule IDs against select/ignore patterns."""
+        assert self.config_manager._matches_patterns("PTCM001", ["PTCM001"])
+        assert self.config_manager._matches_patterns("PTCM001", ["PTAS", "PTCM"])
+        assert self.config_manager._matches_patterns("PTCM001", ["PT"])
+        assert not self.config_manager._matches_patterns("PTCM001", ["PTCM002", "PTAS"])
+        assert not self.config_manager._matches_patterns("PTCM001", [])
+
+    def test_is_rule_enabled_for_rules_outside_builtin_set(self) -> None:
+        """Test that unknown rule IDs are still resolved against select/ignore."""
+        self.config_manager.load_config()
+        self.config_manager.apply_overrides({"select": ["PTXX", "PTCM003"], "ignore": ["PTXX002"]})
+
+        assert self.config_manager.is_rule_enabled("PTXX001") is True
+        assert self.config_manager.is_rule_enabled("PTXX002") is False
+        assert self.config_manager.is_rule_enabled("PTCM003") is True
+        assert self.config_manager.is_rule_enabled("PTCM001") is False
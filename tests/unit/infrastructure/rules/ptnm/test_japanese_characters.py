@@ -2,6 +2,7 @@
 
 import ast
 from pathlib import Path
+from unittest.mock import patch
 
 from pytestee.domain.analyzers.pattern_analyzer import PatternAnalyzer
 from pytestee.domain.models import (
@@ -13,6 +14,23 @@ from pytestee.domain.models import (
 )
 from pytestee.domain.rules.naming.japanese_characters import PTNM001
 
+# Rules never inspect the module AST, so one empty tree is shared by all tests
+_EMPTY_AST = ast.parse("")
+
+
+def _make_function(name: str, lineno: int = 1, col_offset: int = 0) -> TestFunction:
+    """Create an empty test function with the given name."""
+    return TestFunction(
+        name=name,
+        lineno=lineno,
+        col_offset=col_offset,
+        end_lineno=None,
+        end_col_offset=None,
+        body=[],
+        decorators=[],
+        docstring=None,
+    )
+
 
 class TestPTNM001:
     """Test cases for PTNM001 Japanese characters rule."""
@@ -23,7 +41,7 @@ class TestPTNM001:
         self.test_file = TestFile(
             path=Path("/test/dummy.py"),
             content="",
-            ast_tree=ast.parse(""),
+            ast_tree=_EMPTY_AST,
             test_functions=[],
             test_classes=[],
         )
@@ -36,16 +54,7 @@ class TestPTNM001:
 
     def test_japanese_test_method_returns_info(self) -> None:
         """Test that test method with Japanese characters returns info."""
-        test_function = TestFunction(
-            name="test_ユーザー作成",
-            lineno=1,
-            col_offset=0,
-            end_lineno=None,
-            end_col_offset=None,
-            body=[],
-            decorators=[],
-            docstring=None,
-        )
+        test_function = _make_function("test_ユーザー作成")
 
         result = self.rule.check(test_function, self.test_file)
 
@@ -56,16 +65,7 @@ class TestPTNM001:
 
     def test_english_test_method_returns_error(self) -> None:
         """Test that test method without Japanese characters returns error."""
-        test_function = TestFunction(
-            name="test_user_creation",
-            lineno=1,
-            col_offset=0,
-            end_lineno=None,
-            end_col_offset=None,
-            body=[],
-            decorators=[],
-            docstring=None,
-        )
+        test_function = _make_function("test_user_creation")
 
         result = self.rule.check(test_function, self.test_file)
 
@@ -76,16 +76,7 @@ class TestPTNM001:
 
     def test_mixed_japanese_english_returns_info(self) -> None:
         """Test that test method with mixed Japanese and English returns info."""
-        test_function = TestFunction(
-            name="test_ユーザー_creation",
-            lineno=1,
-            col_offset=0,
-            end_lineno=None,
-            end_col_offset=None,
-            body=[],
-            decorators=[],
-            docstring=None,
-        )
+        test_function = _make_function("test_ユーザー_creation")
 
         result = self.rule.check(test_function, self.test_file)
 
@@ -101,16 +92,7 @@ class TestPTNM001:
         ]
 
         for method_name, case_type in test_cases:
-            test_function = TestFunction(
-                name=method_name,
-                lineno=1,
-                col_offset=0,
-                end_lineno=None,
-                end_col_offset=None,
-                body=[],
-                decorators=[],
-                docstring=None,
-            )
+            test_function = _make_function(method_name)
 
             result = self.rule.check(test_function, self.test_file)
 
@@ -120,21 +102,25 @@ class TestPTNM001:
 
     def test_non_test_method_ignored(self) -> None:
         """Test that non-test methods are ignored."""
-        test_function = TestFunction(
-            name="helper_method",
-            lineno=1,
-            col_offset=0,
-            end_lineno=None,
-            end_col_offset=None,
-            body=[],
-            decorators=[],
-            docstring=None,
-        )
+        test_function = _make_function("helper_method")
 
         result = self.rule.check(test_function, self.test_file)
 
         assert result is not None
 
+    def test_non_test_method_skips_japanese_detection(self) -> None:
+        """Test that the name prefix check short-circuits before Japanese detection."""
+        test_function = _make_function("ヘルパー_method")
+
+        with patch.object(
+            self.rule._analyzer, "has_japanese_characters"
+        ) as mock_has_japanese:
+            result = self.rule.check(test_function, self.test_file)
+
+        mock_has_japanese.assert_not_called()
+        assert isinstance(result, CheckFailure)
+        assert "テスト関数ではありません" in result.message
+
     def test_contains_japanese_characters_method(self) -> None:
         """Test Japanese character detection through analyzer."""
         # Test cases with expected results
@@ -150,33 +136,26 @@ class TestPTNM001:
         ]
 
         for text, expected in test_cases:
-            test_function = TestFunction(
-                name=text,
-                lineno=1,
-                col_offset=0,
-                end_lineno=None,
-                end_col_offset=None,
-                body=[],
-                decorators=[],
-                docstring=None,
-            )
+            test_function = _make_function(text)
             result = self.rule._analyzer.has_japanese_characters(test_function)
             assert result == expected, (
                 f"Failed for '{text}': expected {expected}, got {result}"
             )
 
+    def test_japanese_detection_uses_precompiled_pattern(self) -> None:
+        """Test that detection does not compile a regex on each call."""
+        test_function = _make_function("test_ユーザー")
+
+        with patch("re.compile") as mock_compile, patch("re.search") as mock_search:
+            for _ in range(3):
+                assert self.rule._analyzer.has_japanese_characters(test_function)
+
+        mock_compile.assert_not_called()
+        mock_search.assert_not_called()
+
     def test_result_contains_correct_metadata(self) -> None:
         """Test that results contain correct metadata."""
-        test_function = TestFunction(
-            name="test_ユーザー作成",
-            lineno=42,
-            col_offset=4,
-            end_lineno=None,
-            end_col_offset=None,
-            body=[],
-            decorators=[],
-            docstring=None,
-        )
+        test_function = _make_function("test_ユーザー作成", lineno=42, col_offset=4)
 
         result = self.rule.check(test_function, self.test_file)
 
@@ -14,6 +14,9 @@ from pytestee.domain.models import (
 )
 from pytestee.domain.rules.naming.japanese_class_names import PTNM002
 
+# Rules never inspect the module AST, so one empty tree is shared by all tests
+_EMPTY_AST = ast.parse("")
+
 
 class TestPTNM002:
     """Test cases for PTNM002 Japanese class names rule."""
@@ -24,7 +27,7 @@ class TestPTNM002:
         self.test_file = TestFile(
             path=Path("/test/dummy.py"),
             content="",
-            ast_tree=ast.parse(""),
+            ast_tree=_EMPTY_AST,
             test_functions=[],
             test_classes=[],
         )
@@ -14,6 +14,9 @@ from pytestee.domain.models import (
 )
 from pytestee.domain.rules.naming.test_class_method_count import PTNM003
 
+# Rules never inspect the module AST, so one empty tree is shared by all tests
+_EMPTY_AST = ast.parse("")
+
 
 class TestPTNM003:
     """Test cases for PTNM003 test class method count rule."""
@@ -24,7 +27,7 @@ class TestPTNM003:
         self.test_file = TestFile(
             path=Path("/test/dummy.py"),
             content="",
-            ast_tree=ast.parse(""),
+            ast_tree=_EMPTY_AST,
             test_functions=[],
             test_classes=[],
         )
@@ -3,43 +3,78 @@
 import ast
 from pathlib import Path
 
+import pytest
+
 from pytestee.domain.models import TestFile
 from pytestee.infrastructure.ast_parser import ASTParser
 
 
+@pytest.fixture(scope="module")
+def parser() -> ASTParser:
+    """Share one stateless parser across the module."""
+    return ASTParser()
+
+
+@pytest.fixture(scope="module")
+def fixtures_dir() -> Path:
+    """Directory holding the sample test files."""
+    return Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def good_aaa_file(parser: ASTParser, fixtures_dir: Path) -> TestFile:
+    """Parse the AAA-compliant sample file once per module."""
+    return parser.parse_file(fixtures_dir / "good_aaa_test.py")
+
+
 class TestASTParser:
     """Test cases for AST parser."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.parser = ASTParser()
-        self.fixtures_dir = Path(__file__).parent.parent / "fixtures"
-
-    def test_parse_file_with_valid_test_file(self) -> None:
+    def test_parse_file_with_valid_test_file(
+        self, good_aaa_file: TestFile, fixtures_dir: Path
+    ) -> None:
         """Test parsing a valid test file."""
-        test_file_path = self.fixtures_dir / "good_aaa_test.py"
-
-        result = self.parser.parse_file(test_file_path)
+        result = good_aaa_file
 
         assert isinstance(result, TestFile)
-        assert result.path == test_file_path
+        assert result.path == fixtures_dir / "good_aaa_test.py"
         assert len(result.test_functions) == 2
         assert result.content is not None
         assert isinstance(result.ast_tree, ast.AST)
 
-    def test_extract_test_functions(self) -> None:
+    def test_parse_file_is_cached_until_file_changes(
+        self, parser: ASTParser, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unchanged files are parsed once and edited files again."""
+        test_file_path = tmp_path / "test_cached.py"
+        test_file_path.write_text("def test_one():\n    assert True\n")
+
+        first = parser.parse_file(test_file_path)
+        monkeypatch.chdir(tmp_path)
+        second = parser.parse_file(Path("test_cached.py"))
+        assert second.ast_tree is first.ast_tree
+        assert second is not first
+        assert second.test_functions is not first.test_functions
+        assert second.path == Path("test_cached.py")
+        assert ASTParser().parse_file(test_file_path).ast_tree is not first.ast_tree
+
+        test_file_path.write_text(
+            "def test_one():\n    assert True\n\n\ndef test_two():\n    assert True\n"
+        )
+        edited = parser.parse_file(test_file_path)
+        assert edited.ast_tree is not first.ast_tree
+        assert [func.name for func in edited.test_functions] == ["test_one", "test_two"]
+
+    def test_extract_test_functions(self, good_aaa_file: TestFile) -> None:
         """Test extracting test functions from AST."""
-        test_file_path = self.fixtures_dir / "good_aaa_test.py"
-        result = self.parser.parse_file(test_file_path)
-
-        function_names = [func.name for func in result.test_functions]
+        function_names = [func.name for func in good_aaa_file.test_functions]
         assert "test_user_creation_with_aaa_comments" in function_names
         assert "test_user_creation_with_structural_separation" in function_names
         assert (
             "create_user" not in function_names
         )  # Helper function should not be included
 
-    def test_is_test_function_detection(self) -> None:
+    def test_is_test_function_detection(self, parser: ASTParser) -> None:
         """Test detection of test functions."""
         code = """
 def test_something():
@@ -57,49 +92,55 @@ def test_parametrized():
             node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
         ]
 
-        assert self.parser._is_test_function(functions[0])  # test_something
-        assert not self.parser._is_test_function(functions[1])  # not_a_test
-        assert self.parser._is_test_function(functions[2])  # test_parametrized
+        assert parser._is_test_function(functions[0])  # test_something
+        assert not parser._is_test_function(functions[1])  # not_a_test
+        assert parser._is_test_function(functions[2])  # test_parametrized
 
-    def test_count_assert_statements(self) -> None:
+    def test_count_assert_statements(
+        self, parser: ASTParser, fixtures_dir: Path
+    ) -> None:
         """Test counting assert statements."""
-        test_file_path = self.fixtures_dir / "bad_test.py"
-        result = self.parser.parse_file(test_file_path)
+        test_file_path = fixtures_dir / "bad_test.py"
+        result = parser.parse_file(test_file_path)
 
-        # Find test_too_many_assertions function
-        target_function = None
-        for func in result.test_functions:
-            if func.name == "test_too_many_assertions":
-                target_function = func
-                break
+        target_function = result.functions_by_name.get("test_too_many_assertions")
 
         assert target_function is not None
-        assert_count = self.parser.count_assert_statements(target_function)
+        assert_count = parser.count_assert_statements(target_function)
         assert assert_count == 6  # Should count all assert statements
 
-    def test_get_function_lines(self) -> None:
+    def test_get_function_lines(
+        self, parser: ASTParser, good_aaa_file: TestFile
+    ) -> None:
         """Test getting function line count."""
-        test_file_path = self.fixtures_dir / "good_aaa_test.py"
-        result = self.parser.parse_file(test_file_path)
-
-        for func in result.test_functions:
-            lines = self.parser.get_function_lines(func)
+        for func in good_aaa_file.test_functions:
+            lines = parser.get_function_lines(func)
             assert lines > 0
 
-    def test_find_comments(self) -> None:
-        """Test finding comments in test functions."""
-        test_file_path = self.fixtures_dir / "good_aaa_test.py"
-        result = self.parser.parse_file(test_file_path)
+    def test_effective_line_count_computed_at_parse_time(self, tmp_path: Path) -> None:
+        """Test that blank lines, comments and the def line are not counted."""
+        test_file_path = tmp_path / "test_effective_lines.py"
+        test_file_path.write_text(
+            "def test_one():\n"
+            "    # Arrange\n"
+            "    value = 1\n"
+            "\n"
+            "    # Assert\n"
+            "    assert value == 1\n"
+        )
 
-        # Find function with AAA comments
-        target_function = None
-        for func in result.test_functions:
-            if func.name == "test_user_creation_with_aaa_comments":
-                target_function = func
-                break
+        result = ASTParser().parse_file(test_file_path)
+
+        assert result.test_functions[0].effective_line_count == 2
+
+    def test_find_comments(self, parser: ASTParser, good_aaa_file: TestFile) -> None:
+        """Test finding comments in test functions."""
+        target_function = good_aaa_file.functions_by_name.get(
+            "test_user_creation_with_aaa_comments"
+        )
 
         assert target_function is not None
-        comments = self.parser.find_comments(target_function, result.content)
+        comments = parser.find_comments(target_function, good_aaa_file.content)
 
         comment_texts = [comment[1] for comment in comments]
         assert any("# Arrange" in comment for comment in comment_texts)
@@ -1,5 +1,8 @@
 """Tests for rule validation system."""
 
+import pickle
+import re
+
 import pytest
 
 from pytestee.domain.analyzers.assertion_analyzer import AssertionAnalyzer
@@ -9,6 +12,7 @@ from pytestee.domain.rules.assertion.high_assertion_density import PTAS003
 from pytestee.domain.rules.assertion.no_assertions import PTAS004
 from pytestee.domain.rules.assertion.too_few_assertions import PTAS001
 from pytestee.domain.rules.assertion.too_many_assertions import PTAS002
+from pytestee.domain.rules.base_rule import BaseRule
 from pytestee.domain.rules.comment.aaa_comment_pattern import PTCM001
 from pytestee.domain.rules.comment.gwt_comment_pattern import PTCM002
 from pytestee.domain.rules.rule_validator import (
@@ -17,63 +21,114 @@ from pytestee.domain.rules.rule_validator import (
 )
 from pytestee.domain.rules.structure.structural_pattern import PTST001
 
+# Rule selections shared by several tests; frozen since validation only reads them
+_COMPATIBLE_RULES = frozenset({"PTCM001", "PTAS001", "PTAS003"})
+_PATTERN_RULES = frozenset({"PTCM001", "PTCM002"})
+_ASSERTION_COUNT_CONFLICT = frozenset({"PTAS001", "PTAS005"})
+_NO_ASSERTION_CONFLICT = frozenset({"PTAS004", "PTAS001", "PTAS002"})
+
+
+@pytest.fixture(scope="module")
+def rule_instances() -> dict[str, BaseRule]:
+    """Build the rule registry once; validation only reads it."""
+    assertion_analyzer = AssertionAnalyzer()
+    pattern_analyzer = PatternAnalyzer()
+    return {
+        "PTCM001": PTCM001(pattern_analyzer),
+        "PTCM002": PTCM002(pattern_analyzer),
+        "PTST001": PTST001(),
+        "PTAS001": PTAS001(assertion_analyzer),
+        "PTAS002": PTAS002(assertion_analyzer),
+        "PTAS003": PTAS003(assertion_analyzer),
+        "PTAS004": PTAS004(assertion_analyzer),
+        "PTAS005": PTAS005(assertion_analyzer),
+    }
+
 
 class TestRuleValidator:
     """Test rule validation functionality."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        assertion_analyzer = AssertionAnalyzer()
-        pattern_analyzer = PatternAnalyzer()
-        self.rule_instances = {
-            "PTCM001": PTCM001(pattern_analyzer),
-            "PTCM002": PTCM002(pattern_analyzer),
-            "PTST001": PTST001(),
-            "PTAS001": PTAS001(assertion_analyzer),
-            "PTAS002": PTAS002(assertion_analyzer),
-            "PTAS003": PTAS003(assertion_analyzer),
-            "PTAS004": PTAS004(assertion_analyzer),
-            "PTAS005": PTAS005(assertion_analyzer),
-        }
-
-    def test_validate_rule_selection_no_conflicts(self) -> None:
+    @pytest.mark.parametrize(
+        "selected_rules",
+        [
+            pytest.param(_COMPATIBLE_RULES, id="compatible_rules"),
+            # Multiple pattern detection rules are allowed (priority-based, not conflicts)
+            pytest.param(_PATTERN_RULES, id="pattern_rules"),
+        ],
+    )
+    def test_validate_rule_selection_no_conflicts(
+        self, rule_instances: dict[str, BaseRule], selected_rules: frozenset[str]
+    ) -> None:
         """Test validation with no conflicting rules."""
-        # Compatible rules
-        selected_rules = {"PTCM001", "PTAS001", "PTAS003"}
-
         # Should not raise any exception
-        RuleValidator.validate_rule_selection(selected_rules, self.rule_instances)
-
-    def test_validate_rule_selection_pattern_no_conflicts(self) -> None:
-        """Test validation allows multiple pattern rules (priority-based)."""
-        # Multiple pattern detection rules are allowed (priority-based, not conflicts)
-        selected_rules = {"PTCM001", "PTCM002"}
-
-        # Should not raise any exception
-        RuleValidator.validate_rule_selection(selected_rules, self.rule_instances)
-
-    def test_validate_rule_selection_assertion_conflicts(self) -> None:
-        """Test validation detects assertion rule conflicts."""
-        # Conflicting assertion count rules
-        selected_rules = {"PTAS001", "PTAS005"}  # too_few vs assertion_count_ok
-
+        RuleValidator.validate_rule_selection(selected_rules, rule_instances)
+
+    @pytest.mark.parametrize(
+        ("selected_rules", "expected_pairs"),
+        [
+            # too_few vs assertion_count_ok
+            pytest.param(
+                _ASSERTION_COUNT_CONFLICT,
+                (("PTAS001", "PTAS005"),),
+                id="assertion_count",
+            ),
+            # PTAS004 conflicts with all other assertion count rules
+            pytest.param(
+                _NO_ASSERTION_CONFLICT,
+                (("PTAS001", "PTAS004"), ("PTAS002", "PTAS004")),
+                id="no_assertions",
+            ),
+        ],
+    )
+    def test_validate_rule_selection_conflicts(
+        self,
+        rule_instances: dict[str, BaseRule],
+        selected_rules: frozenset[str],
+        expected_pairs: tuple[tuple[str, ...], ...],
+    ) -> None:
+        """Test validation detects conflicting assertion rules."""
         with pytest.raises(RuleConflictError) as exc_info:
-            RuleValidator.validate_rule_selection(selected_rules, self.rule_instances)
+            RuleValidator.validate_rule_selection(selected_rules, rule_instances)
 
-        assert "PTAS001, PTAS005" in str(exc_info.value)
+        assert exc_info.value.conflicting_rules == expected_pairs
 
-    def test_validate_rule_selection_no_assertion_conflicts(self) -> None:
-        """Test validation detects no-assertion rule conflicts."""
-        # PTAS004 conflicts with all other assertion count rules
-        selected_rules = {"PTAS004", "PTAS001", "PTAS002"}
-
-        with pytest.raises(RuleConflictError) as exc_info:
-            RuleValidator.validate_rule_selection(selected_rules, self.rule_instances)
+    def test_rule_conflict_error_formats_message_lazily(self) -> None:
+        """Test that conflict groups are kept and only formatted by __str__."""
+        error = RuleConflictError(
+            conflicting_rules=[("PTAS001", "PTAS004"), ("PTAS002", "PTAS004")]
+        )
 
-        # Should detect conflicts between PTAS004 and both PTAS001 and PTAS002
-        error_msg = str(exc_info.value)
-        assert "PTAS001, PTAS004" in error_msg
-        assert "PTAS002, PTAS004" in error_msg
+        assert error.args == (None, (("PTAS001", "PTAS004"), ("PTAS002", "PTAS004")))
+        assert str(error).splitlines() == [
+            "Conflicting rules detected:",
+            "Rules PTAS001, PTAS004 are mutually exclusive",
+            "Rules PTAS002, PTAS004 are mutually exclusive",
+        ]
+        assert str(RuleConflictError("explicit message")) == "explicit message"
+
+    def test_rule_conflict_error_survives_pickling(self) -> None:
+        """Test that repr and pickling keep the message and conflict groups."""
+        error = RuleConflictError(conflicting_rules=[("PTAS001", "PTAS004")])
+        explicit = RuleConflictError("explicit message")
+
+        restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+        restored_explicit = pickle.loads(pickle.dumps(explicit))  # noqa: S301
+
+        assert restored.conflicting_rules == (("PTAS001", "PTAS004"),)
+        assert str(restored) == str(error)
+        assert str(restored_explicit) == "explicit message"
+        assert "PTAS001" in repr(error)
+
+    def test_validate_rule_selection_conflict_declared_by_one_side(
+        self, rule_instances: dict[str, BaseRule]
+    ) -> None:
+        """Test that a conflict is found when only one selected rule has an instance."""
+        partial_instances = {"PTAS005": rule_instances["PTAS005"]}
+
+        with pytest.raises(RuleConflictError, match="PTAS001, PTAS005"):
+            RuleValidator.validate_rule_selection(
+                _ASSERTION_COUNT_CONFLICT, partial_instances
+            )
 
     def test_validate_config_parameters_valid(self) -> None:
         """Test validation with valid configuration parameters."""
@@ -82,6 +137,11 @@ class TestRuleValidator:
         # Should not raise any exception
         RuleValidator.validate_config_parameters(config)
 
+    def test_validate_config_parameters_unrelated_keys(self) -> None:
+        """Test that configs without assertion parameters validate against defaults."""
+        RuleValidator.validate_config_parameters({})
+        RuleValidator.validate_config_parameters({"max_methods": 10})
+
     def test_validate_config_parameters_min_max_conflict(self) -> None:
         """Test validation detects min > max conflict."""
         config = {
@@ -89,22 +149,19 @@ class TestRuleValidator:
             "max_asserts": 3,  # Invalid: min > max
         }
 
-        with pytest.raises(RuleConflictError) as exc_info:
+        with pytest.raises(
+            RuleConflictError,
+            match=re.escape("min_asserts (5) cannot be greater than max_asserts (3)"),
+        ):
             RuleValidator.validate_config_parameters(config)
 
-        assert "min_asserts (5) cannot be greater than max_asserts (3)" in str(
-            exc_info.value
-        )
-
     def test_validate_config_parameters_negative_min(self) -> None:
         """Test validation detects negative min_asserts."""
         config = {"min_asserts": -1}
 
-        with pytest.raises(RuleConflictError) as exc_info:
+        with pytest.raises(RuleConflictError, match="min_asserts cannot be negative"):
             RuleValidator.validate_config_parameters(config)
 
-        assert "min_asserts cannot be negative" in str(exc_info.value)
-
     def test_validate_config_parameters_invalid_max(self) -> None:
         """Test validation detects invalid max_asserts."""
         config = {
@@ -112,13 +169,19 @@ class TestRuleValidator:
             "max_asserts": 0,  # Invalid: must be at least 1
         }
 
-        with pytest.raises(RuleConflictError) as exc_info:
+        # Will trigger min > max error first
+        with pytest.raises(
+            RuleConflictError,
+            match=re.escape("min_asserts (1) cannot be greater than max_asserts (0)"),
+        ):
             RuleValidator.validate_config_parameters(config)
 
-        # Will trigger min > max error first
-        assert "min_asserts (1) cannot be greater than max_asserts (0)" in str(
-            exc_info.value
-        )
+    def test_validate_config_parameters_max_below_one(self) -> None:
+        """Test validation detects max_asserts below 1 when min is not larger."""
+        config = {"min_asserts": 0, "max_asserts": 0}
+
+        with pytest.raises(RuleConflictError, match="max_asserts must be at least 1"):
+            RuleValidator.validate_config_parameters(config)
 
     def test_validate_config_parameters_invalid_density(self) -> None:
         """Test validation detects invalid density range."""
@@ -126,43 +189,47 @@ class TestRuleValidator:
             "max_density": 1.5  # Invalid: must be between 0.0 and 1.0
         }
 
-        with pytest.raises(RuleConflictError) as exc_info:
+        with pytest.raises(
+            RuleConflictError,
+            match=re.escape("max_density must be between 0.0 and 1.0"),
+        ):
             RuleValidator.validate_config_parameters(config)
 
-        assert "max_density must be between 0.0 and 1.0" in str(exc_info.value)
-
-    def test_get_compatible_rules_pattern_rule(self) -> None:
-        """Test getting compatible rules for a pattern detection rule."""
-        compatible = RuleValidator.get_compatible_rules("PTCM001", self.rule_instances)
-
-        # Should include all other rules (pattern rules don't have conflicts)
-        assert "PTAS001" in compatible
-        assert "PTAS003" in compatible
-        assert "PTCM002" in compatible  # Pattern rules don't conflict
-        assert "PTST001" in compatible  # Pattern rules don't conflict
-        assert "PTCM001" not in compatible  # Excluded (is the base rule)
-
-    def test_get_compatible_rules_assertion_rule(self) -> None:
-        """Test getting compatible rules for an assertion rule."""
-        compatible = RuleValidator.get_compatible_rules("PTAS001", self.rule_instances)
-
-        # Should include pattern rules and non-conflicting assertion rules
-        assert "PTCM001" in compatible
-        assert "PTST001" in compatible
-        assert "PTAS003" in compatible  # High density doesn't conflict with too_few
-        assert "PTAS005" not in compatible  # Excluded due to conflict
-        assert "PTAS004" not in compatible  # Excluded due to conflict
-        assert "PTAS001" not in compatible  # Excluded (is the base rule)
-
-    def test_get_compatible_rules_no_assertion_rule(self) -> None:
-        """Test getting compatible rules for PTAS004 (no assertions)."""
-        compatible = RuleValidator.get_compatible_rules("PTAS004", self.rule_instances)
-
-        # Should include pattern rules but exclude other assertion count rules
-        assert "PTCM001" in compatible
-        assert "PTST001" in compatible
-        assert "PTAS003" in compatible  # Density is compatible with no assertions
-        assert "PTAS001" not in compatible  # Excluded due to conflict
-        assert "PTAS002" not in compatible  # Excluded due to conflict
-        assert "PTAS005" not in compatible  # Excluded due to conflict
-        assert "PTAS004" not in compatible  # Excluded (is the base rule)
+    @pytest.mark.parametrize(
+        ("rule_id", "included", "excluded"),
+        [
+            # Pattern rules don't conflict with anything
+            pytest.param(
+                "PTCM001",
+                {"PTAS001", "PTAS003", "PTCM002", "PTST001"},
+                {"PTCM001"},
+                id="pattern_rule",
+            ),
+            # High density doesn't conflict with too_few
+            pytest.param(
+                "PTAS001",
+                {"PTCM001", "PTST001", "PTAS003"},
+                {"PTAS001", "PTAS004", "PTAS005"},
+                id="assertion_rule",
+            ),
+            # Density is compatible with no assertions
+            pytest.param(
+                "PTAS004",
+                {"PTCM001", "PTST001", "PTAS003"},
+                {"PTAS001", "PTAS002", "PTAS004", "PTAS005"},
+                id="no_assertion_rule",
+            ),
+        ],
+    )
+    def test_get_compatible_rules(
+        self,
+        rule_instances: dict[str, BaseRule],
+        rule_id: str,
+        included: set[str],
+        excluded: set[str],
+    ) -> None:
+        """Test that compatible rules exclude the base rule and its conflicts."""
+        compatible = RuleValidator.get_compatible_rules(rule_id, rule_instances)
+
+        assert included <= compatible
+        assert not excluded & compatible